@@ -2,6 +2,7 @@
 
 import argparse
 import sys
+import time
 from pathlib import Path
 
 from badweathermounttester import __version__
@@ -26,6 +27,10 @@ class Application:
         self.display = SimulatorDisplay(config.display)
         self.display.set_southern_hemisphere(config.mount.southern_hemisphere)
         self.server = WebServer(config, setup_path, forced_locale=forced_locale)
+        # Last ellipse fit, keyed by the calibration points it was computed from
+        self._ellipse_cache: Tuple[Optional[tuple], Optional[dict]] = (None, None)
+        # Set when calibration points change; the ellipse is refit once per frame in run()
+        self._cal_dirty = False
 
         # Set up callbacks
         self.server.on_connect(self._on_client_connect)
@@ -67,46 +72,39 @@ class Application:
             4: DisplayMode.VELOCITY_MEASURE,
             5: DisplayMode.SIMULATION,
         }
-        if mode in mode_map:
-            self.display.set_mode(mode_map[mode])
-
-            # When entering calibration mode, initialize points from config
-            if mode == 3:
-                points = [(p[0], p[1]) for p in self.config.calibration.points]
-                self.display.set_calibration_points(points)
-                self._update_calibration_ellipse()
-
-            # When entering velocity measurement mode, initialize calibration points and ellipse
-            if mode == 4:
-                points = [(p[0], p[1]) for p in self.config.calibration.points]
-                self.display.set_calibration_points(points)
-                ellipse = fit_ellipse(self.config.calibration.points)
-                self.display.set_calibration_ellipse(ellipse)
-
-            # When entering simulation mode, initialize calibration points and ellipse
-            if mode == 5:
-                points = [(p[0], p[1]) for p in self.config.calibration.points]
-                self.display.set_calibration_points(points)
-                ellipse = fit_ellipse(self.config.calibration.points)
-                self.display.set_calibration_ellipse(ellipse)
+        if mode in (3, 4, 5):
+            # Calibration, velocity measurement and simulation all show the calibration trace
+            points = self.config.calibration.points
+            self.display.update(mode=mode_map[mode], points=points, ellipse=self._cached_ellipse(points))
+        elif mode in mode_map:
+            self.display.update(mode=mode_map[mode])
 
     def _on_calibration_hover(self, x: int, y: int) -> None:
         """Handle calibration hover position change."""
         self.display.set_calibration_hover(x, y)
 
+    def _cached_ellipse(self, points) -> Optional[dict]:
+        """Return the ellipse fit for the given points, reusing the last fit if they are unchanged."""
+        key = tuple((p[0], p[1]) for p in points)
+        cached_key, cached_ellipse = self._ellipse_cache
+        if key == cached_key:
+            return cached_ellipse
+        ellipse = fit_ellipse(points)
+        self._ellipse_cache = (key, ellipse)
+        return ellipse
+
     def _update_calibration_ellipse(self) -> None:
         """Recompute and update the ellipse fit for calibration points."""
-        ellipse = fit_ellipse(self.display.calibration_points)
+        ellipse = self._cached_ellipse(self.display.calibration_points)
         self.display.set_calibration_ellipse(ellipse)
 
     def _sync_calibration_from_config(self) -> None:
         """Sync display calibration points from config to ensure consistency."""
-        points = [(p[0], p[1]) for p in self.config.calibration.points]
-        self.display.set_calibration_points(points)
+        self.display.set_calibration_points(self.config.calibration.points)
         # Adjust selected index if needed
         if self.display.calibration_selected_index >= len(self.display.calibration_points):
-            self.display.calibration_selected_index = len(self.display.calibration_points) - 1
-        self._update_calibration_ellipse()
+            self.display.set_calibration_selected_index(len(self.display.calibration_points) - 1)
+        self._cal_dirty = True
 
     def _on_calibration_click(self, x: int, y: int) -> None:
         """Handle calibration point click."""
@@ -130,9 +128,8 @@ class Application:
     def _on_velocity_setup(self, pixels_per_second: float) -> None:
         """Handle velocity measurement setup."""
         # Make sure ellipse is set from calibration points
-        ellipse = fit_ellipse(self.config.calibration.points)
-        self.display.set_calibration_ellipse(ellipse)
-        self.display.setup_velocity_measurement(pixels_per_second)
+        ellipse = self._cached_ellipse(self.config.calibration.points)
+        self.display.update(ellipse=ellipse, velocity_pixels_per_second=pixels_per_second)
 
     def _on_simulation_setup(
         self,
@@ -144,9 +141,14 @@ class Application:
     ) -> None:
         """Handle simulation setup."""
         # Make sure ellipse is set from calibration points
-        ellipse = fit_ellipse(self.config.calibration.points)
-        self.display.set_calibration_ellipse(ellipse)
-        self.display.setup_simulation(x_start, x_end, pixels_per_second, velocity_profile, velocity_source)
+        ellipse = self._cached_ellipse(self.config.calibration.points)
+        self.display.update(ellipse=ellipse, simulation=dict(
+            x_start=x_start,
+            x_end=x_end,
+            pixels_per_second=pixels_per_second,
+            velocity_profile=velocity_profile,
+            velocity_source=velocity_source,
+        ))
 
     def _on_simulation_start(self) -> None:
         """Handle simulation start."""
@@ -186,12 +188,24 @@ class Application:
             print(f"BWMT started. Connect to: {network_address}")
             log.info("BWMT started. Connect to: %s", network_address)
 
-            # Main loop
+            # Main loop: render, then sleep until the next frame deadline
+            frame_interval = 1.0 / max(1, self.config.display.target_fps)
+            next_deadline = time.monotonic()
             while self.display.running:
                 if not self.display.handle_events():
                     break
+                if self._cal_dirty:
+                    self._cal_dirty = False
+                    self._update_calibration_ellipse()
                 self.display.render()
-                self.display.clock.tick(60)  # 60 FPS
+                self.display.clock.tick()  # no delay, only feeds the FPS counter
+                next_deadline += frame_interval
+                slack = next_deadline - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    # Running late: restart the schedule instead of bursting to catch up
+                    next_deadline = time.monotonic()
 
             return 0
 
@@ -210,69 +224,84 @@ class Application:
             self.server.stop()
 
 
+_PARSER = argparse.ArgumentParser(
+    prog="bwmt",
+    description="Bad Weather Mount Tester - Test telescope mount periodic error indoors",
+)
+_PARSER.add_argument(
+    "--version",
+    action="version",
+    version=f"%(prog)s {__version__}",
+)
+_PARSER.add_argument(
+    "--config",
+    type=Path,
+    help="Path to configuration file (JSON)",
+)
+_PARSER.add_argument(
+    "--setup",
+    type=Path,
+    default=DEFAULT_SETUP_PATH,
+    help="Path to setup file (YAML, default: setup.yml)",
+)
+_PARSER.add_argument(
+    "--port",
+    type=int,
+    default=None,
+    help="Web server port (overrides setup.yml)",
+)
+_PARSER.add_argument(
+    "--windowed",
+    action="store_true",
+    help="Run in windowed mode instead of fullscreen",
+)
+_PARSER.add_argument(
+    "--fullscreen",
+    action="store_true",
+    help="Run in fullscreen mode (overrides setup.yml)",
+)
+_PARSER.add_argument(
+    "--log-config",
+    type=Path,
+    default=None,
+    help="Path to logging configuration file (INI format)",
+)
+_PARSER.add_argument(
+    "--screen-size",
+    type=str,
+    default=None,
+    help="Screen size preset: 640x480/vga, hd/720p, fhd/1080p (default), 4k/2160p, custom",
+)
+_PARSER.add_argument(
+    "--locale",
+    type=str,
+    default=None,
+    metavar="LANG",
+    help="Force display language, e.g. 'de' or 'fr' (default: system locale)",
+)
+_PARSER.add_argument(
+    "-g", "--geometry",
+    action="store_true",
+    help="Run the geometry visualisation tool instead of the main application",
+)
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="bwmt",
-        description="Bad Weather Mount Tester - Test telescope mount periodic error indoors",
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
-    )
-    parser.add_argument(
-        "--config",
-        type=Path,
-        help="Path to configuration file (JSON)",
-    )
-    parser.add_argument(
-        "--setup",
-        type=Path,
-        default=DEFAULT_SETUP_PATH,
-        help="Path to setup file (YAML, default: setup.yml)",
-    )
-    parser.add_argument(
-        "--port",
-        type=int,
-        default=None,
-        help="Web server port (overrides setup.yml)",
-    )
-    parser.add_argument(
-        "--windowed",
-        action="store_true",
-        help="Run in windowed mode instead of fullscreen",
-    )
-    parser.add_argument(
-        "--fullscreen",
-        action="store_true",
-        help="Run in fullscreen mode (overrides setup.yml)",
-    )
-    parser.add_argument(
-        "--log-config",
-        type=Path,
-        default=None,
-        help="Path to logging configuration file (INI format)",
-    )
-    parser.add_argument(
-        "--screen-size",
-        type=str,
-        default=None,
-        help="Screen size preset: 640x480/vga, hd/720p, fhd/1080p (default), 4k/2160p, custom",
-    )
-    parser.add_argument(
-        "--locale",
-        type=str,
-        default=None,
-        metavar="LANG",
-        help="Force display language, e.g. 'de' or 'fr' (default: system locale)",
-    )
-    parser.add_argument(
-        "-g", "--geometry",
-        action="store_true",
-        help="Run the geometry visualisation tool instead of the main application",
-    )
-    return parser.parse_args()
+    return _PARSER.parse_args()
+
+
+def load_startup_config(config_path: Optional[Path], setup_path: Path) -> AppConfig:
+    """Load the startup configuration. Priority: --config (JSON) > --setup (YAML) > defaults.
+
+    An existing but empty setup file is filled with the default template by AppConfig.load_yaml.
+    """
+    config = config_path and AppConfig.try_load(config_path)
+    if config:
+        return config
+    if setup_path.exists():
+        return AppConfig.load_yaml(setup_path)
+    return AppConfig()
 
 
 def main() -> int:
@@ -290,13 +319,7 @@ def main() -> int:
     log.info("Logging to %s", log_file)
 
     # Load or create configuration
-    # Priority: --config (JSON) > --setup (YAML) > defaults
-    if args.config and args.config.exists():
-        config = AppConfig.load(args.config)
-    elif args.setup.exists():
-        config = AppConfig.load_yaml(args.setup)
-    else:
-        config = AppConfig()
+    config = load_startup_config(args.config, args.setup)
 
     # Apply locale override before any display strings are rendered
     init_translations(args.locale)
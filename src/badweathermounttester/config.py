@@ -1,13 +1,30 @@
 """Configuration handling for Bad Weather Mount Tester."""
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 import json
+import math
 from pathlib import Path
+from types import MappingProxyType
 
-import yaml
+try:
+    import orjson
 
+    def _json_dumps(data, indent: bool = False) -> bytes:
+        """Serialize data to UTF-8 JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional (the "fast" extra)
+    def _json_dumps(data, indent: bool = False) -> bytes:
+        """Serialize data to UTF-8 JSON bytes."""
+        if indent:
+            return json.dumps(data, indent=2).encode()
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+
+@dataclass(slots=True)
 class MountConfig:
     """Configuration for the mount being tested."""
 
@@ -22,8 +39,8 @@ class MountConfig:
     angle_stop_deg: float = -1.0             # geometry sweep stop angle (°)
     declination_deg: float | None = None      # line-of-sight declination (°); None = not set
 
-# Screen size presets
-SCREEN_SIZE_PRESETS = {
+# Screen size presets; any other screen_size (e.g. "custom") uses screen_width/height as configured
+SCREEN_SIZE_PRESETS = MappingProxyType({
     "640x480": (640, 480),
     "vga": (640, 480),
     "xga": (1024, 768),
@@ -33,11 +50,10 @@ SCREEN_SIZE_PRESETS = {
     "1080p": (1920, 1080),
     "4k": (3840, 2160),
     "2160p": (3840, 2160),
-    "custom": None,  # Use screen_width and screen_height directly
-}
+})
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """Configuration for the display/simulator."""
 
@@ -49,17 +65,16 @@ class DisplayConfig:
     star_size: float = 3.0  # Full Width at Half Maximum of simulated star in pixels
     star_brightness: int = 255
     target_y_ratio: float = 0.5  # Vertical position ratio for target crosshair (0=top, 1=bottom)
+    target_fps: int = 60  # Frame rate cap of the display main loop
 
     def apply_screen_size_preset(self) -> None:
         """Apply screen size preset to screen_width and screen_height."""
-        preset = self.screen_size.lower()
-        if preset in SCREEN_SIZE_PRESETS:
-            dimensions = SCREEN_SIZE_PRESETS[preset]
-            if dimensions is not None:
-                self.screen_width, self.screen_height = dimensions
+        dimensions = SCREEN_SIZE_PRESETS.get(self.screen_size.lower())
+        if dimensions:
+            self.screen_width, self.screen_height = dimensions
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Configuration for the web server."""
 
@@ -67,7 +82,7 @@ class ServerConfig:
     port: int = 5050
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraConfig:
     """Configuration for the guiding camera."""
 
@@ -76,7 +91,7 @@ class CameraConfig:
     height_px: int = 960  # Sensor height in pixels
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationConfig:
     """Configuration for the calibration trace line."""
 
@@ -84,7 +99,7 @@ class CalibrationConfig:
     is_complete: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class VelocityMeasurementConfig:
     """Configuration for velocity measurement results."""
 
@@ -96,11 +111,79 @@ class VelocityMeasurementConfig:
     sim_velocity_override_px_s: float | None = None  # Direct simulation velocity override in simulator px/s
 
 
+# Config file sections and the dataclass each one is loaded into
+_SECTIONS = (
+    ("mount", MountConfig),
+    ("display", DisplayConfig),
+    ("server", ServerConfig),
+    ("camera", CameraConfig),
+    ("calibration", CalibrationConfig),
+    ("velocity", VelocityMeasurementConfig),
+)
+_FIELD_NAMES = {section_cls: frozenset(f.name for f in fields(section_cls)) for _, section_cls in _SECTIONS}
+
 # Default path for setup configuration
 DEFAULT_SETUP_PATH = Path("setup.yml")
 
 
-@dataclass
+def _yaml_cache_path(path: Path) -> Path:
+    """Return the path of the parsed-JSON sidecar cache for a YAML setup file."""
+    return path.with_suffix(path.suffix + ".cache.json")
+
+
+def _source_key(path: Path) -> list:
+    """Return the mtime/size pair that identifies the current contents of a file."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _is_finite_json(data) -> bool:
+    """Return whether data holds no NaN or infinite floats, which JSON cannot round-trip."""
+    if isinstance(data, float):
+        return math.isfinite(data)
+    if isinstance(data, dict):
+        return all(_is_finite_json(value) for value in data.values())
+    if isinstance(data, list):
+        return all(_is_finite_json(value) for value in data)
+    return True
+
+
+def _write_yaml_cache(path: Path, source_key: list, data) -> None:
+    """Write the JSON sidecar cache for a YAML file. Failing to write it is not an error.
+
+    Data with .nan/.inf values is not cached (orjson would write them as null), so it is parsed from YAML each time.
+    """
+    if not _is_finite_json(data):
+        return
+    try:
+        _yaml_cache_path(path).write_bytes(_json_dumps({"source": source_key, "data": data}))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _read_yaml_cached(path: Path):
+    """Parse a YAML file, reusing the JSON sidecar cache if the file is unchanged.
+
+    The sidecar stores the source file's mtime and size next to the parsed data.
+    On a mismatch (or a missing/corrupt sidecar) the YAML is parsed again and the
+    sidecar is rewritten. Failing to write the sidecar is not an error.
+    """
+    source_key = _source_key(path)
+    try:
+        cached = _json_loads(_yaml_cache_path(path).read_bytes())
+        if cached["source"] == source_key:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    import yaml  # deferred: only needed when the sidecar cache misses
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # SafeLoader if built without libyaml
+    data = yaml.load(path.read_bytes(), Loader=loader)
+    _write_yaml_cache(path, source_key, data)
+    return data
+
+
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration."""
 
@@ -112,117 +195,86 @@ class AppConfig:
     velocity: VelocityMeasurementConfig = field(default_factory=VelocityMeasurementConfig)
 
     def to_dict(self) -> dict:
-        """Convert configuration to a dictionary."""
-        return {
-            "mount": {
-                "latitude": self.mount.latitude,
-                "focal_length_mm": self.mount.focal_length_mm,
-                "distance_to_screen_m": self.mount.distance_to_screen_m,
-                "main_period_seconds": self.mount.main_period_seconds,
-                "southern_hemisphere": self.mount.southern_hemisphere,
-                "telescope_offset_m":     self.mount.telescope_offset_m,
-                "telescope_offset_dec_m": self.mount.telescope_offset_dec_m,
-                "angle_start_deg":        self.mount.angle_start_deg,
-                "angle_stop_deg":         self.mount.angle_stop_deg,
-                "declination_deg":        self.mount.declination_deg,
-            },
-            "display": {
-                "fullscreen": self.display.fullscreen,
-                "screen_size": self.display.screen_size,
-                "screen_width": self.display.screen_width,
-                "screen_height": self.display.screen_height,
-                "screen_width_mm": self.display.screen_width_mm,
-                "star_size": self.display.star_size,
-                "star_brightness": self.display.star_brightness,
-                "target_y_ratio": self.display.target_y_ratio,
-            },
-            "server": {
-                "host": self.server.host,
-                "port": self.server.port,
-            },
-            "camera": {
-                "pixel_size_um": self.camera.pixel_size_um,
-                "width_px": self.camera.width_px,
-                "height_px": self.camera.height_px,
-            },
-            "calibration": {
-                "points": self.calibration.points,
-                "is_complete": self.calibration.is_complete,
-            },
-            "velocity": {
-                "left_time_seconds": self.velocity.left_time_seconds,
-                "middle_time_seconds": self.velocity.middle_time_seconds,
-                "right_time_seconds": self.velocity.right_time_seconds,
-                "stripe_width_pixels": self.velocity.stripe_width_pixels,
-                "is_complete": self.velocity.is_complete,
-                "sim_velocity_override_px_s": self.velocity.sim_velocity_override_px_s,
-            },
-        }
+        """Convert configuration to a dictionary (keys in field declaration order)."""
+        return asdict(self)
 
     def save(self, path: Path) -> None:
         """Save configuration to a JSON file."""
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        path.write_bytes(_json_dumps(self.to_dict(), indent=True))
+
+    def to_yaml(self) -> str:
+        """Convert configuration to YAML text."""
+        import yaml
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)  # SafeDumper if built without libyaml
+        return yaml.dump(self.to_dict(), Dumper=dumper, default_flow_style=False, sort_keys=False)
 
     def save_yaml(self, path: Path = DEFAULT_SETUP_PATH) -> None:
-        """Save configuration to a YAML file."""
-        path.write_text(yaml.safe_dump(self.to_dict(), default_flow_style=False, sort_keys=False))
+        """Save configuration to a YAML file.
+
+        The JSON sidecar cache is refreshed too, so the next load does not re-parse the YAML.
+        """
+        data = self.to_dict()
+        path.write_text(self.to_yaml())
+        _write_yaml_cache(path, _source_key(path), data)
 
     @classmethod
-    def _apply_dict(cls, config: "AppConfig", data: dict) -> None:
-        """Apply dictionary values to a config object."""
-        if "mount" in data:
-            for key, value in data["mount"].items():
-                if hasattr(config.mount, key):
-                    setattr(config.mount, key, value)
-
-        if "display" in data:
-            for key, value in data["display"].items():
-                if hasattr(config.display, key):
-                    setattr(config.display, key, value)
-
-        if "server" in data:
-            for key, value in data["server"].items():
-                if hasattr(config.server, key):
-                    setattr(config.server, key, value)
-
-        if "camera" in data:
-            for key, value in data["camera"].items():
-                if hasattr(config.camera, key):
-                    setattr(config.camera, key, value)
-
-        if "calibration" in data:
-            for key, value in data["calibration"].items():
-                if hasattr(config.calibration, key):
-                    setattr(config.calibration, key, value)
-
-        if "velocity" in data:
-            for key, value in data["velocity"].items():
-                if hasattr(config.velocity, key):
-                    setattr(config.velocity, key, value)
+    def _from_dict(cls, data: dict) -> "AppConfig":
+        """Build a config object from a dictionary, ignoring unknown keys.
+
+        A document or section that is not a mapping (e.g. a hand-edited file holding a list) is treated as empty.
+        """
+        if not isinstance(data, dict):
+            data = {}
+        sections = {}
+        for name, section_cls in _SECTIONS:
+            allowed = _FIELD_NAMES[section_cls]
+            values = data.get(name)
+            if not isinstance(values, dict):
+                values = {}
+            sections[name] = section_cls(**{key: value for key, value in values.items() if key in allowed})
+
+        config = cls(**sections)
+        config.display.apply_screen_size_preset()
+        return config
 
     @classmethod
     def load(cls, path: Path) -> "AppConfig":
-        """Load configuration from a JSON file."""
-        if not path.exists():
-            return cls()
+        """Load configuration from a JSON file, or return defaults if it does not exist."""
+        return cls.try_load(path) or cls()
 
-        data = json.loads(path.read_text())
-        config = cls()
-        cls._apply_dict(config, data)
-        config.display.apply_screen_size_preset()
-        return config
+    @classmethod
+    def try_load(cls, path: Path) -> "AppConfig | None":
+        """Load configuration from a JSON file, or return None if it does not exist."""
+        try:
+            data = _json_loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        return cls._from_dict(data)
+
+    @classmethod
+    def try_load_yaml(cls, path: Path = DEFAULT_SETUP_PATH) -> "AppConfig | None":
+        """Load configuration from a YAML file, or return None if it does not exist or is empty."""
+        try:
+            data = _read_yaml_cached(path)
+        except FileNotFoundError:
+            return None
+        if data is None:
+            return None   # empty file
+        return cls._from_dict(data)
 
     @classmethod
     def load_yaml(cls, path: Path = DEFAULT_SETUP_PATH) -> "AppConfig":
-        """Load configuration from a YAML file."""
-        if not path.exists() or yaml.safe_load(path.read_text()) is None:
-            config = cls()
-            config.save_yaml(path)   # write full template with all keys + defaults
-            config.display.apply_screen_size_preset()
-            return config
-
-        data = yaml.safe_load(path.read_text())
+        """Load configuration from a YAML file.
+
+        Unchanged files are read from a JSON sidecar cache instead of being re-parsed.
+        A missing or empty file is replaced by a template with every key at its default.
+        """
+        return cls.try_load_yaml(path) or cls._write_template(path)
+
+    @classmethod
+    def _write_template(cls, path: Path) -> "AppConfig":
+        """Write the default configuration to a YAML file and return it."""
         config = cls()
-        cls._apply_dict(config, data)
+        config.save_yaml(path)   # write full template with all keys + defaults
         config.display.apply_screen_size_preset()
         return config
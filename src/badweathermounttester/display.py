@@ -6,10 +6,13 @@ This module handles the pygame-based display that shows:
 - The simulated star for guiding
 """
 
+import bisect
 import gettext
 import locale
 import math
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 import warnings
@@ -22,7 +25,7 @@ with warnings.catch_warnings():
     import pygame
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple, List, Dict
+from typing import Callable, Optional, Sequence, Tuple, List, Dict
 
 from badweathermounttester.config import DisplayConfig
 from badweathermounttester.logging_setup import get_app_logger, get_simulation_logger
@@ -30,6 +33,36 @@ from badweathermounttester.logging_setup import get_app_logger, get_simulation_l
 log_app = get_app_logger()
 log_sim = get_simulation_logger()
 
+# Monotonic clock for simulation timing: unaffected by wall-clock adjustments
+_now = time.perf_counter
+
+# Marks SimulatorDisplay.update() arguments that were not passed (None is a valid ellipse)
+_UNSET = object()
+
+# Event types handle_events() reacts to
+_EXPOSE_EVENTS = frozenset((pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED))
+_HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, *_EXPOSE_EVENTS]
+
+# Font sizes used by the render methods; the fonts are created once in init()
+_FONT_SIZES = (12, 20, 24, 28, 36, 48, 72, 200)
+
+# Maximum pixel memory of the rendered text surfaces kept by SimulatorDisplay._text_surface().
+# The cache holds the fixed labels, point numbers and status lines, a few MB even at 72 pt;
+# a byte bound rather than an entry count keeps large-font strings from piling up on small machines.
+_TEXT_CACHE_BYTES = 16 * 1024 * 1024
+
+# Remaining simulation seconds at which a beep sounds, ascending: the 10 ... 1 second countdown
+# (a beep as each second starts) and the 30 and 60 second warnings
+_BEEP_THRESHOLDS = (2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 30.0, 60.0)
+
+# Number of samples in the uniform elapsed-time tables used by the variable-velocity simulation
+_TIME_GRID_SIZE = 4096
+
+# Locator arrow field: grid spacing, half arrow length and wing length in pixels
+_LOCATOR_SPACING = 20
+_ARROW_HALF = 10 // 2
+_ARROW_WING = 10 // 3
+
 
 def _setup_translations(lang: Optional[str] = None) -> Callable[[str], str]:
     """Load .mo translations for the given locale code, or detect from the system locale.
@@ -77,28 +110,74 @@ def generate_beep_sound(
         pygame.mixer.Sound object
     """
     num_samples = int(sample_rate * duration_ms / 1000)
-    t = np.linspace(0, duration_ms / 1000, num_samples, dtype=np.float32)
 
-    # Generate sine wave with fade in/out to avoid clicks
-    wave = np.sin(2 * np.pi * frequency * t)
+    # Generate sine wave in place in one float32 buffer; samples span the clip evenly, end to end
+    step = 2 * np.pi * frequency * (duration_ms / 1000) / max(num_samples - 1, 1)
+    wave = np.arange(num_samples, dtype=np.float32)
+    wave *= step
+    np.sin(wave, out=wave)
 
-    # Apply envelope (fade in/out over 10ms)
+    # Scale to 16-bit integer range and apply volume, with the envelope (fade in/out over 10ms,
+    # to avoid clicks) folded into the same pass: every sample is multiplied exactly once
+    amplitude = volume * 32767
     fade_samples = int(sample_rate * 0.01)
     if fade_samples > 0 and num_samples > 2 * fade_samples:
-        fade_in = np.linspace(0, 1, fade_samples)
-        fade_out = np.linspace(1, 0, fade_samples)
+        fade_in = np.linspace(0, amplitude, fade_samples, dtype=np.float32)
         wave[:fade_samples] *= fade_in
-        wave[-fade_samples:] *= fade_out
+        wave[fade_samples:-fade_samples] *= amplitude
+        wave[-fade_samples:] *= fade_in[::-1]
+    else:
+        wave *= amplitude
 
-    # Scale to 16-bit integer range and apply volume
-    wave = (wave * volume * 32767).astype(np.int16)
-
-    # Create stereo by duplicating the channel
-    stereo_wave = np.column_stack((wave, wave))
+    # Create stereo by writing the channel into both columns of the int16 buffer
+    stereo_wave = np.empty((num_samples, 2), dtype=np.int16)
+    stereo_wave[:, 0] = wave
+    stereo_wave[:, 1] = stereo_wave[:, 0]
 
     return pygame.mixer.Sound(buffer=stereo_wave)
 
 
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Return the pixel memory of a surface in bytes."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def _ellipse_y(coeffs: Sequence[float], x: float, use_upper_arc: bool) -> Optional[float]:
+    """Solve the conic Ax² + Bxy + Cy² + Dx + Ey + F = 0 for y at x on one arc.
+
+    Returns the upper (smaller y) or lower (larger y) solution, or None if the ellipse has no point at x.
+    """
+    A, B, C, D, E, F = coeffs
+    # Quadratic coefficients for y: Cy² + (Bx + E)y + (Ax² + Dx + F) = 0
+    qb = B * x + E
+    qc = A * x * x + D * x + F
+    discriminant = qb * qb - 4 * C * qc
+    if discriminant < 0 or abs(C) < 1e-10:
+        return None
+
+    sqrt_disc = math.sqrt(discriminant)
+    y1 = (-qb + sqrt_disc) / (2 * C)
+    y2 = (-qb - sqrt_disc) / (2 * C)
+    return min(y1, y2) if use_upper_arc else max(y1, y2)
+
+
+def _ellipse_ys(coeffs: Sequence[float], xs: np.ndarray, use_upper_arc: bool) -> np.ndarray:
+    """Vectorized _ellipse_y() over an array of x values; NaN where the ellipse has no point."""
+    A, B, C, D, E, F = coeffs
+    if abs(C) < 1e-10:
+        return np.full(len(xs), np.nan)
+    qb = B * xs + E
+    qc = A * xs * xs + D * xs + F
+    discriminant = qb * qb - 4 * C * qc
+    solvable = discriminant >= 0
+    sqrt_disc = np.sqrt(np.where(solvable, discriminant, 0.0))
+    y1 = (-qb + sqrt_disc) / (2 * C)
+    y2 = (-qb - sqrt_disc) / (2 * C)
+    ys = np.minimum(y1, y2) if use_upper_arc else np.maximum(y1, y2)
+    ys[~solvable] = np.nan
+    return ys
+
+
 class DisplayMode(Enum):
     """Current display mode."""
 
@@ -110,7 +189,19 @@ class DisplayMode(Enum):
     SIMULATION = auto()
 
 
-@dataclass
+# Modes whose picture only changes through a setter; render() skips them until something changes
+_STATIC_MODES = frozenset(
+    (
+        DisplayMode.WAITING,
+        DisplayMode.LOCATOR,
+        DisplayMode.ALIGN,
+        DisplayMode.CALIBRATION,
+        DisplayMode.VELOCITY_MEASURE,
+    )
+)
+
+
+@dataclass(slots=True, frozen=True)
 class StarPosition:
     """Position of the simulated star."""
 
@@ -134,6 +225,8 @@ class SimulatorDisplay:
         self.calibration_points: List[Tuple[int, int]] = []
         self.calibration_selected_index: int = -1  # -1 means no selection
         self.calibration_ellipse: Optional[Dict] = None  # Ellipse parameters dict
+        # Whether the points lie on the ellipse's upper arc; None until needed after a change
+        self._upper_arc: Optional[bool] = None
         # Simulation state
         self.simulation_running: bool = False
         self.simulation_start_time: Optional[float] = None
@@ -146,17 +239,32 @@ class SimulatorDisplay:
         self.simulation_lookup_ts: Optional[np.ndarray] = None
         self.simulation_lookup_vs: Optional[np.ndarray] = None
         self.simulation_total_time: float = 0.0
+        # The x lookup table resampled on a uniform elapsed-time grid, so a lookup is an index, not a search
+        self._time_grid_inv_step: float = 0.0
+        self._time_grid_xs: List[float] = []
+        # Quadratic velocity profile v(x) = (a*x + b)*x + c as plain floats
+        self._velocity_coeffs: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        # Column-normalized Vandermonde matrix of the last velocity profile fit and its column norms,
+        # keyed by its x positions
+        self._profile_vander_key: Optional[bytes] = None
+        self._profile_vander: Optional[np.ndarray] = None
+        self._profile_scale: Optional[np.ndarray] = None
         # duration of each simulation step in seconds
         self.simu_render: Optional[float] = None
         # Audio/beep state
         self.beep_sound: Optional[pygame.mixer.Sound] = None
         self.beep_end_sound: Optional[pygame.mixer.Sound] = None  # Lower, longer beep for end
-        self.beep_60s_triggered: bool = False
-        self.beep_30s_triggered: bool = False
-        self.countdown_last_second: int = -1  # Track last countdown second beeped
+        # Index of the lowest beep threshold reached so far; thresholds from here on have sounded
+        self._beep_index: int = len(_BEEP_THRESHOLDS)
         self.beep_end_triggered: bool = False  # Track if end beep was played
         # Logo surface (loaded in init)
         self.logo: Optional[pygame.Surface] = None
+        # Fonts by size (the fixed sizes are created in init, others on first use) and calibration instruction text
+        self._fonts: Dict[int, pygame.font.Font] = {}
+        # Rendered text surfaces by (font size, text, color), least recently used first
+        self._text_cache: OrderedDict = OrderedDict()
+        self._text_cache_bytes = 0
+        self._cal_instructions: Optional[pygame.Surface] = None
         # Velocity measurement state
         self.velocity_stripe_width: int = 0  # Width of each stripe in pixels
         self.velocity_pixels_per_second: float = 0.0  # Calculated velocity
@@ -166,6 +274,34 @@ class SimulatorDisplay:
         self.southern_hemisphere: bool = False
         # Simulation completion logging guard
         self._simulation_complete_logged: bool = False
+        # Guards display state against changes from the web server thread mid-frame
+        self._state_lock = threading.Lock()
+        # Screen areas drawn by the last simulation frame; None forces a full redraw
+        self._sim_rects: Optional[List[pygame.Rect]] = None
+        # Last rendered countdown text and its surface; it changes every second, so it bypasses the text cache
+        self._countdown_text: Optional[str] = None
+        self._countdown_surface: Optional[pygame.Surface] = None
+        # Set by the setters when the picture may have changed since the last render()
+        self._dirty = True
+        # Pre-rendered waiting screen, keyed by (network_address, width, height), and its
+        # address-independent layer (title, logo, instructions), keyed by (width, height)
+        self._waiting_key: Optional[Tuple[str, int, int]] = None
+        self._waiting_surface: Optional[pygame.Surface] = None
+        self._waiting_background_key: Optional[Tuple[int, int]] = None
+        self._waiting_background: Optional[pygame.Surface] = None
+        # Pre-rendered locator screen, keyed by (width, height, target_x, target_y)
+        self._locator_key: Optional[Tuple[int, int, int, int]] = None
+        self._locator_surface: Optional[pygame.Surface] = None
+        # Polylines of the ellipse trace on the velocity screen, keyed by (coeffs, width, height, upper arc)
+        self._trace_key: Optional[tuple] = None
+        self._trace_runs: List[List[List[int]]] = []
+        # Rotated, repeated velocity stripe labels, keyed by (label, screen height, color)
+        self._stripe_labels: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+        # Crosshair sprites with a transparent colorkey, keyed by (size, color)
+        self._crosshair_sprites: Dict[Tuple[int, Tuple[int, int, int]], pygame.Surface] = {}
+        # Pre-rendered grid with black as transparent colorkey, keyed by (width, height, parts, color)
+        self._grid_key: Optional[tuple] = None
+        self._grid_surface: Optional[pygame.Surface] = None
 
     def init(self) -> None:
         """Initialize pygame and create the display."""
@@ -183,12 +319,22 @@ class SimulatorDisplay:
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # Only queue the events handle_events() looks at; everything else is dropped by SDL
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
+
         # Hide the mouse cursor
         pygame.mouse.set_visible(False)
 
         # Load logo
         self._load_logo()
 
+        # Fonts at every fixed size the render methods use, and the calibration instruction line
+        self._fonts = {size: pygame.font.Font(None, size) for size in _FONT_SIZES}
+        self._cal_instructions = self._fonts[28].render(
+            _("Move mouse on web UI to position crosshair, click to record point"), True, (200, 200, 200)
+        ).convert_alpha()
+
         # Initialize audio system and generate beep sound
         self._init_audio()
 
@@ -223,9 +369,7 @@ class SimulatorDisplay:
 
     def reset_beep_state(self) -> None:
         """Reset beep tracking state. Call when simulation is reset."""
-        self.beep_60s_triggered = False
-        self.beep_30s_triggered = False
-        self.countdown_last_second = -1
+        self._beep_index = len(_BEEP_THRESHOLDS)
         self.beep_end_triggered = False
 
     def _check_and_play_beeps(self, remaining_seconds: float, complete: bool) -> None:
@@ -249,57 +393,83 @@ class SimulatorDisplay:
         if not self.simulation_running:
             return
 
-        # 60 second warning
-        if not self.beep_60s_triggered and remaining_seconds <= 60.0 and remaining_seconds > 59.0:
-            self.play_beep()
-            self.beep_60s_triggered = True
-
-        # 30 second warning
-        if not self.beep_30s_triggered and remaining_seconds <= 30.0 and remaining_seconds > 29.0:
+        # Beep when a new threshold is reached, unless it was passed more than a second ago
+        # (e.g. by skipping ahead). Seeking back re-arms the thresholds above the remaining time.
+        index = bisect.bisect_left(_BEEP_THRESHOLDS, remaining_seconds)
+        if index < self._beep_index and remaining_seconds > _BEEP_THRESHOLDS[index] - 1.0:
             self.play_beep()
-            self.beep_30s_triggered = True
-
-        # Countdown from 10 to 1
-        if remaining_seconds <= 10.0 and remaining_seconds > 0:
-            current_second = int(remaining_seconds)
-            # Beep when we cross into a new second (10, 9, 8, ... 1)
-            if current_second != self.countdown_last_second and current_second >= 1:
-                self.play_beep()
-                self.countdown_last_second = current_second
+        self._beep_index = index
 
     def set_network_address(self, address: str) -> None:
         """Set the network address to display on the waiting screen."""
         self.network_address = address
+        self._dirty = True
 
     def set_southern_hemisphere(self, val: bool) -> None:
         """Set whether southern hemisphere mode is active."""
         self.southern_hemisphere = val
+        self._dirty = True
+
+    def update(
+        self,
+        *,
+        mode: Optional[DisplayMode] = None,
+        points: Optional[Sequence[Sequence[int]]] = None,
+        ellipse=_UNSET,
+        velocity_pixels_per_second: Optional[float] = None,
+        simulation: Optional[Dict] = None,
+    ) -> None:
+        """Apply several state changes at once, so a frame never sees half of them.
+
+        ``simulation`` holds the keyword arguments for setup_simulation().
+        """
+        with self._state_lock:
+            if points is not None:
+                self.set_calibration_points(points)
+            if ellipse is not _UNSET:
+                self.set_calibration_ellipse(ellipse)
+            if velocity_pixels_per_second is not None:
+                self.setup_velocity_measurement(velocity_pixels_per_second)
+            if simulation is not None:
+                self.setup_simulation(**simulation)
+            if mode is not None:
+                self.set_mode(mode)
 
     def set_mode(self, mode: DisplayMode) -> None:
         """Change the display mode."""
         self.mode = mode
+        self._dirty = True
 
     def set_star_position(self, x: float, y: float) -> None:
         """Set the position of the simulated star."""
         self.star_position = StarPosition(x, y)
+        self._dirty = True
 
     def set_calibration_hover(self, x: int, y: int) -> None:
         """Set the calibration hover crosshair position."""
         self.calibration_hover_position = (x, y)
+        self._dirty = True
+
+    def set_calibration_points(self, points: Sequence[Sequence[int]]) -> None:
+        """Set all calibration points, sorted by x coordinate.
 
-    def set_calibration_points(self, points: List[Tuple[int, int]]) -> None:
-        """Set all calibration points, sorted by x coordinate."""
-        self.calibration_points = sorted(points, key=lambda p: p[0])
+        Accepts any sequence of (x, y) pairs, e.g. the config's list of [x, y] lists.
+        """
+        self.calibration_points = sorted(((p[0], p[1]) for p in points), key=lambda p: p[0])
+        self._upper_arc = None
+        self._dirty = True
 
     def add_calibration_point(self, x: int, y: int) -> int:
-        """Add a single calibration point and sort by x coordinate.
+        """Add a single calibration point, keeping the points sorted by x coordinate.
 
-        Returns the index of the newly added point after sorting.
+        Returns the index of the newly added point.
         """
-        self.calibration_points.append((x, y))
-        self.calibration_points.sort(key=lambda p: p[0])
-        # Find the index of the newly added point
-        return next(i for i, p in enumerate(self.calibration_points) if p == (x, y))
+        # Insert after any points with the same x, where a stable sort would have put it
+        index = bisect.bisect_right(self.calibration_points, x, key=lambda p: p[0])
+        self.calibration_points.insert(index, (x, y))
+        self._upper_arc = None
+        self._dirty = True
+        return index
 
     def clear_calibration_points(self) -> None:
         """Clear all calibration points."""
@@ -307,19 +477,26 @@ class SimulatorDisplay:
         self.calibration_hover_position = None
         self.calibration_selected_index = -1
         self.calibration_ellipse = None
+        self._upper_arc = None
+        self._dirty = True
 
     def set_calibration_selected_index(self, index: int) -> None:
         """Set the selected calibration point index."""
         self.calibration_selected_index = index
+        self._dirty = True
 
     def set_calibration_ellipse(self, ellipse: Optional[Dict]) -> None:
         """Set the ellipse parameters for the fitted curve."""
         self.calibration_ellipse = ellipse
+        self._upper_arc = None
+        self._dirty = True
 
     def update_calibration_point(self, index: int, x: int, y: int) -> None:
         """Update a specific calibration point's position."""
         if 0 <= index < len(self.calibration_points):
             self.calibration_points[index] = (x, y)
+            self._upper_arc = None
+            self._dirty = True
 
     def setup_simulation(
         self,
@@ -350,25 +527,44 @@ class SimulatorDisplay:
 
         if velocity_profile is not None and len(velocity_profile) >= 3:
             # Fit quadratic polynomial through measured velocity points
-            profile_xs = np.array([p[0] for p in velocity_profile])
-            profile_vs = np.array([p[1] for p in velocity_profile])
-            coeffs = np.polyfit(profile_xs, profile_vs, 2)
-
-            # Create dense x grid from x_start to x_end
-            lookup_xs = np.linspace(float(x_start), float(x_end), 1000)
+            profile = np.asarray(velocity_profile, dtype=float)
+            profile_xs, profile_vs = profile[:, 0], profile[:, 1]
+            # The stripe positions rarely change between setups, so reuse their Vandermonde matrix.
+            # Its columns are scaled to unit norm like np.polyfit does: at pixel-scale x the
+            # x² column would otherwise make the system badly conditioned.
+            xs_key = profile_xs.tobytes()
+            if xs_key != self._profile_vander_key:
+                vander = np.vander(profile_xs, 3)
+                scale = np.linalg.norm(vander, axis=0)
+                scale[scale == 0] = 1.0
+                self._profile_vander_key = xs_key
+                self._profile_vander = vander / scale
+                self._profile_scale = scale
+            coeffs, *_ = np.linalg.lstsq(self._profile_vander, profile_vs, rcond=None)
+            coeffs /= self._profile_scale
+            self._velocity_coeffs = tuple(coeffs.tolist())
+
+            # Create dense, evenly spaced x grid from x_start to x_end
+            dx = (x_end - x_start) / 999
+            lookup_xs = x_start + dx * np.arange(1000, dtype=float)
+            lookup_xs[-1] = x_end
             # Evaluate velocity at each x, clamp to minimum 0.01 px/s
             lookup_vs = np.maximum(np.polyval(coeffs, lookup_xs), 0.01)
 
             # Compute cumulative time: dt[i] = |dx| / avg_velocity between points
-            dx = np.diff(lookup_xs)
             avg_vs = (lookup_vs[:-1] + lookup_vs[1:]) / 2.0
-            dt = np.abs(dx) / avg_vs
+            dt = abs(dx) / avg_vs
             lookup_ts = np.concatenate(([0.0], np.cumsum(dt)))
 
             self.simulation_lookup_xs = lookup_xs
             self.simulation_lookup_ts = lookup_ts
             self.simulation_lookup_vs = lookup_vs
             self.simulation_total_time = float(lookup_ts[-1])
+
+            time_grid = np.linspace(0.0, self.simulation_total_time, _TIME_GRID_SIZE)
+            self._time_grid_xs = np.interp(time_grid, lookup_ts, lookup_xs).tolist()
+            total_time = self.simulation_total_time
+            self._time_grid_inv_step = (_TIME_GRID_SIZE - 1) / total_time if total_time > 0 else 0.0
         else:
             self.simulation_lookup_xs = None
             self.simulation_lookup_ts = None
@@ -381,13 +577,13 @@ class SimulatorDisplay:
             self.simulation_running = True
             # Set start_time so that elapsed calculation gives correct value
             # start_time = now - already_elapsed
-            self.simulation_start_time = time.time() - self.simulation_elapsed
+            self.simulation_start_time = _now() - self.simulation_elapsed
 
     def stop_simulation(self) -> None:
         """Stop/pause the simulation."""
         if self.simulation_running and self.simulation_start_time is not None:
             # Store the elapsed time before pausing
-            self.simulation_elapsed = time.time() - self.simulation_start_time
+            self.simulation_elapsed = _now() - self.simulation_start_time
         self.simulation_running = False
 
     def reset_simulation(self) -> None:
@@ -405,21 +601,30 @@ class SimulatorDisplay:
         total_distance = abs(self.simulation_x_end - self.simulation_x_start)
         return total_distance / self.simulation_pixels_per_second if self.simulation_pixels_per_second > 0 else 0
 
+    def _sample_time_grid(self, values: List[float], elapsed: float) -> float:
+        """Linearly interpolate a table sampled on the uniform elapsed-time grid, clamped at both ends."""
+        pos = elapsed * self._time_grid_inv_step
+        if pos <= 0:
+            return values[0]
+        i = int(pos)
+        if i >= len(values) - 1:
+            return values[-1]
+        v0 = values[i]
+        return v0 + (pos - i) * (values[i + 1] - v0)
+
     def _x_from_elapsed(self, elapsed: float) -> float:
         """Get the x position from elapsed time."""
-        if self.simulation_lookup_ts is not None and self.simulation_lookup_xs is not None:
-            return float(np.interp(elapsed, self.simulation_lookup_ts, self.simulation_lookup_xs))
+        if self.simulation_lookup_ts is not None:
+            return self._sample_time_grid(self._time_grid_xs, elapsed)
         _direction = 1 if self.simulation_x_end >= self.simulation_x_start else -1
         return self.simulation_x_start + _direction * elapsed * self.simulation_pixels_per_second
 
-    def _velocity_from_elapsed(self, elapsed: float) -> float:
-        """Get the instantaneous velocity (px/s) at the given elapsed time."""
-        if (
-            self.simulation_lookup_ts is not None
-            and self.simulation_lookup_xs is not None
-            and self.simulation_lookup_vs is not None
-        ):
-            return float(np.interp(elapsed, self.simulation_lookup_ts, self.simulation_lookup_vs))
+    def _velocity_at_x(self, x: float) -> float:
+        """Get the instantaneous velocity (px/s) at position x, as returned by _x_from_elapsed()."""
+        if self.simulation_lookup_ts is not None:
+            # Evaluate the fitted profile at the current position, clamped like the lookup table
+            a, b, c = self._velocity_coeffs
+            return max((a * x + b) * x + c, 0.01)
         return self.simulation_pixels_per_second
 
     def skip_simulation(self, seconds: float) -> None:
@@ -430,11 +635,11 @@ class SimulatorDisplay:
             # Currently running - adjust start time
             self.simulation_start_time -= seconds
             # Clamp
-            elapsed = time.time() - self.simulation_start_time
+            elapsed = _now() - self.simulation_start_time
             if elapsed < 0:
-                self.simulation_start_time = time.time()
+                self.simulation_start_time = _now()
             elif elapsed > total_time:
-                self.simulation_start_time = time.time() - total_time
+                self.simulation_start_time = _now() - total_time
         else:
             # Paused - adjust stored elapsed time
             self.simulation_elapsed += seconds
@@ -453,7 +658,7 @@ class SimulatorDisplay:
 
         if self.simulation_running and self.simulation_start_time is not None:
             # Currently running - adjust start time so elapsed calculation is correct
-            self.simulation_start_time = time.time() - elapsed_seconds
+            self.simulation_start_time = _now() - elapsed_seconds
         else:
             # Paused - set stored elapsed time directly
             self.simulation_elapsed = elapsed_seconds
@@ -470,6 +675,7 @@ class SimulatorDisplay:
         # Ensure minimum width of 50 pixels
         if self.velocity_stripe_width < 50:
             self.velocity_stripe_width = 50
+        self._dirty = True
 
     def get_velocity_stripe_width(self) -> int:
         """Get the current velocity stripe width."""
@@ -489,37 +695,23 @@ class SimulatorDisplay:
         if not self.calibration_ellipse or "coeffs" not in self.calibration_ellipse:
             return None
 
-        A, B, C, D, E, F = self.calibration_ellipse["coeffs"]
-        center_y = self.calibration_ellipse.get("center_y", 0)
-
-        # Quadratic coefficients for y
-        qa = C
-        qb = B * x + E
-        qc = A * x * x + D * x + F
-
-        discriminant = qb * qb - 4 * qa * qc
-
-        if discriminant < 0 or abs(qa) < 1e-10:
-            return None
+        if use_upper_arc is None:
+            use_upper_arc = self._use_upper_arc()
+        return _ellipse_y(self.calibration_ellipse["coeffs"], x, use_upper_arc)
 
-        sqrt_disc = math.sqrt(discriminant)
-        y1 = (-qb + sqrt_disc) / (2 * qa)
-        y2 = (-qb - sqrt_disc) / (2 * qa)
+    def _use_upper_arc(self) -> bool:
+        """Whether the calibration points lie mostly above the ellipse center (on its upper arc).
 
-        # Determine which arc to use based on calibration points
-        if use_upper_arc is None:
-            # Check if calibration points are mostly above or below center
-            if self.calibration_points:
+        Computed once per change of the points or ellipse.
+        """
+        if self._upper_arc is None:
+            if self.calibration_points and self.calibration_ellipse:
+                center_y = self.calibration_ellipse.get("center_y", 0)
                 points_above = sum(1 for p in self.calibration_points if p[1] < center_y)
-                use_upper_arc = points_above > len(self.calibration_points) / 2
+                self._upper_arc = points_above > len(self.calibration_points) / 2
             else:
-                use_upper_arc = True
-
-        # Pick the appropriate arc consistently
-        if use_upper_arc:
-            return min(y1, y2)  # Upper arc = smaller y value
-        else:
-            return max(y1, y2)  # Lower arc = larger y value
+                self._upper_arc = True
+        return self._upper_arc
 
     def get_simulation_status(self) -> dict:
         """Get current simulation status."""
@@ -540,11 +732,13 @@ class SimulatorDisplay:
 
         # Get elapsed time: from start_time if running, from stored elapsed if paused
         if self.simulation_running and self.simulation_start_time is not None:
-            elapsed = time.time() - self.simulation_start_time
+            elapsed = _now() - self.simulation_start_time
         else:
             elapsed = self.simulation_elapsed
 
         current_x = self._x_from_elapsed(elapsed)
+        # The position is looked up once and shared with the velocity evaluation
+        current_velocity = self._velocity_at_x(current_x)
         # Clamp to x_end in the direction of travel
         if _direction > 0:
             current_x = min(current_x, float(self.simulation_x_end))
@@ -555,8 +749,6 @@ class SimulatorDisplay:
         y = self._ellipse_y_from_x(current_x)
         current_y = y if y is not None else self.calibration_ellipse.get("center_y", 0)
 
-        current_velocity = self._velocity_from_elapsed(elapsed)
-
         distance_traveled = (current_x - self.simulation_x_start) * _direction
         progress = distance_traveled / total_distance * 100 if total_distance > 0 else 100
         remaining = max(0, total_time - elapsed)
@@ -583,14 +775,17 @@ class SimulatorDisplay:
 
     def handle_events(self) -> bool:
         """Process pygame events. Returns False if should quit."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        if not pygame.event.peek(_HANDLED_EVENTS):
+            return True
+        for event in pygame.event.get(_HANDLED_EVENTS):
+            event_type = event.type
+            if event_type == pygame.QUIT or (event_type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
                 self.running = False
                 return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                    return False
+            if event_type in _EXPOSE_EVENTS:
+                # Window contents were lost: redraw everything
+                self._sim_rects = None
+                self._dirty = True
         return True
 
     def render(self) -> None:
@@ -598,20 +793,26 @@ class SimulatorDisplay:
         if not self.screen:
             return
 
-        self.screen.fill((0, 0, 0))
-
-        if self.mode == DisplayMode.WAITING:
-            self._render_waiting()
-        elif self.mode == DisplayMode.LOCATOR:
-            self._render_locator()
-        elif self.mode == DisplayMode.ALIGN:
-            self._render_align()
-        elif self.mode == DisplayMode.CALIBRATION:
-            self._render_calibration()
-        elif self.mode == DisplayMode.VELOCITY_MEASURE:
-            self._render_velocity_measure()
-        elif self.mode == DisplayMode.SIMULATION:
-            self._render_simulation()
+        with self._state_lock:
+            if self.mode == DisplayMode.SIMULATION:
+                self._render_simulation()  # clears and updates only its dirty areas
+                return
+            if self.mode in _STATIC_MODES and not self._dirty:
+                return  # the screen still shows the last frame
+
+            self._dirty = False
+            self._sim_rects = None  # the next simulation frame starts with a full redraw
+            self.screen.fill((0, 0, 0))
+            if self.mode == DisplayMode.WAITING:
+                self._render_waiting()
+            elif self.mode == DisplayMode.LOCATOR:
+                self._render_locator()
+            elif self.mode == DisplayMode.ALIGN:
+                self._render_align()
+            elif self.mode == DisplayMode.CALIBRATION:
+                self._render_calibration()
+            elif self.mode == DisplayMode.VELOCITY_MEASURE:
+                self._render_velocity_measure()
 
         pygame.display.flip()
 
@@ -620,27 +821,58 @@ class SimulatorDisplay:
         if not self.screen:
             return
 
+        # The waiting screen only changes with the address or screen size; draw it once and blit it.
+        # A new address only redraws the address line on a copy of the static layer.
+        size = (self.config.screen_width, self.config.screen_height)
+        if size != self._waiting_background_key:
+            self._waiting_background = self._build_waiting_background()
+            self._waiting_background_key = size
+            self._waiting_key = None
+        key = (self.network_address, *size)
+        if key != self._waiting_key:
+            self._waiting_surface = self._waiting_background.copy()
+            self._draw_waiting_address(self._waiting_surface)
+            self._waiting_key = key
+        self.screen.blit(self._waiting_surface, (0, 0))
+
+    def _waiting_text_width(self) -> int:
+        """Width available to the waiting screen's title and address lines (2% margin on each side)."""
+        return self.config.screen_width - 2 * int(self.config.screen_width * 0.02)
+
+    def _font(self, size: int) -> pygame.font.Font:
+        """Return the default font at the given size, creating it on first use."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def _fit_text(self, text: str, base_size: int, target_width: int, shrink_only: bool = False) -> pygame.font.Font:
+        """Return a font whose rendering of text spans target_width.
+
+        The size is scaled from base_size by the measured width; with shrink_only, a base-size
+        rendering that already fits is kept.
+        """
+        base_font = self._font(base_size)
+        base_width = base_font.size(text)[0]
+        if shrink_only and base_width <= target_width:
+            return base_font
+        return self._font(int(base_size * target_width / base_width))
+
+    def _build_waiting_background(self) -> pygame.Surface:
+        """Draw the static part of the waiting screen (title, logo, instructions) onto a new surface."""
+        surface = pygame.Surface((self.config.screen_width, self.config.screen_height))
+
         # Scale font sizes based on screen height
-        font_small = pygame.font.Font(None, max(20, int(self.config.screen_height * 0.03)))
+        font_small = self._font(max(20, int(self.config.screen_height * 0.03)))
 
-        # Title - dynamically sized to span screen width
+        # Title - scaled from a base font size to span the screen width
         title_text = "Bad Weather Mount Tester"
-        margin = int(self.config.screen_width * 0.02)  # 2% margin on each side
-        target_width = self.config.screen_width - 2 * margin
-
-        # Start with a base font size and calculate the needed size
         base_size = max(36, int(self.config.screen_height * 0.067))
-        base_font = pygame.font.Font(None, base_size)
-        base_title = base_font.render(title_text, True, (255, 255, 255))
-        base_width = base_title.get_width()
-
-        # Scale font size proportionally to fill screen width
-        title_font_size = int(base_size * target_width / base_width)
-        font_large = pygame.font.Font(None, title_font_size)
+        font_large = self._fit_text(title_text, base_size, self._waiting_text_width())
         title = font_large.render(title_text, True, (255, 255, 255))
         title_y = int(self.config.screen_height * 0.1)  # 10% from top
         title_rect = title.get_rect(center=(self.config.screen_width // 2, title_y))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
 
         # Logo - centered on screen
         if self.logo:
@@ -655,127 +887,206 @@ class SimulatorDisplay:
 
             scaled_logo = pygame.transform.smoothscale(self.logo, (new_width, new_height))
             logo_rect = scaled_logo.get_rect(center=(self.config.screen_width // 2, self.config.screen_height // 2))
-            self.screen.blit(scaled_logo, logo_rect)
+            surface.blit(scaled_logo, logo_rect)
 
         # Instructions at bottom
         instructions = font_small.render(_("Press ESC to exit"), True, (150, 150, 150))
         instr_y = self.config.screen_height - int(self.config.screen_height * 0.05)  # 5% from bottom
         instr_rect = instructions.get_rect(center=(self.config.screen_width // 2, instr_y))
-        self.screen.blit(instructions, instr_rect)
+        surface.blit(instructions, instr_rect)
+
+        return surface.convert()
 
+    def _draw_waiting_address(self, surface: pygame.Surface) -> None:
+        """Draw the network address line of the waiting screen onto the given surface."""
         # Network address - just above instructions, dynamically sized to fit screen
         if self.network_address:
             connect_text = f"{_('Connect to:')} {self.network_address}"
-            # Start with a base font size and calculate the needed size
+            # Start with a base font size and scale it down if the text is too wide
             connect_base_size = max(36, int(min(self.config.screen_height, self.config.screen_width) * 0.11))
-            connect_base_font = pygame.font.Font(None, connect_base_size)
-            connect_base = connect_base_font.render(connect_text, True, (100, 255, 100))
-            connect_base_width = connect_base.get_width()
-
-            # If text is too wide, scale it down to fit
-            if connect_base_width > target_width:
-                connect_font_size = int(connect_base_size * target_width / connect_base_width)
-                font_connect = pygame.font.Font(None, connect_font_size)
-            else:
-                font_connect = connect_base_font
-
+            font_connect = self._fit_text(connect_text, connect_base_size, self._waiting_text_width(), shrink_only=True)
             addr_text = font_connect.render(connect_text, True, (100, 255, 100))
             addr_y = self.config.screen_height - int(self.config.screen_height * 0.18)  # 18% from bottom
             addr_rect = addr_text.get_rect(center=(self.config.screen_width // 2, addr_y))
-            self.screen.blit(addr_text, addr_rect)
+            surface.blit(addr_text, addr_rect)
+
+    def _text_surface(self, size: int, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text in the font of the given size, reusing earlier renders of the same text."""
+        key = (size, text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            # Convert once to the display's pixel format so blits need no per-pixel conversion
+            surface = self._fonts[size].render(text, True, color).convert_alpha()
+            cache[key] = surface
+            self._text_cache_bytes += _surface_bytes(surface)
+            while self._text_cache_bytes > _TEXT_CACHE_BYTES and len(cache) > 1:
+                self._text_cache_bytes -= _surface_bytes(cache.popitem(last=False)[1])
+        else:
+            cache.move_to_end(key)
+        return surface
 
-    def _draw_arrow(
+    def _draw_crosshair(
         self,
         x: int,
         y: int,
-        target_x: int,
-        target_y: int,
-        size: int = 10,
-        color: Tuple[int, int, int] = (255, 255, 255),
+        size: int = 5,
+        color: Tuple[int, int, int] = (255, 0, 0),
+        surface: Optional[pygame.Surface] = None,
     ) -> None:
-        """Draw a small arrow at (x, y) pointing toward (target_x, target_y)."""
-        if not self.screen:
-            return
-
-        dx = target_x - x
-        dy = target_y - y
-        dist = math.sqrt(dx * dx + dy * dy)
-        if dist < 1:
-            return
-
-        # Normalize direction
-        dx /= dist
-        dy /= dist
-
-        # Arrow tip is at (x, y), base is behind it
-        tip_x = x + dx * (size // 2)
-        tip_y = y + dy * (size // 2)
-        base_x = x - dx * (size // 2)
-        base_y = y - dy * (size // 2)
-
-        # Perpendicular for arrow wings
-        perp_x = -dy
-        perp_y = dx
-        wing_size = size // 3
-
-        # Draw arrow line
-        pygame.draw.line(self.screen, color, (int(base_x), int(base_y)), (int(tip_x), int(tip_y)), 1)
-
-        # Draw arrow head wings
-        wing1_x = tip_x - dx * wing_size + perp_x * wing_size
-        wing1_y = tip_y - dy * wing_size + perp_y * wing_size
-        wing2_x = tip_x - dx * wing_size - perp_x * wing_size
-        wing2_y = tip_y - dy * wing_size - perp_y * wing_size
-
-        pygame.draw.line(self.screen, color, (int(tip_x), int(tip_y)), (int(wing1_x), int(wing1_y)), 1)
-        pygame.draw.line(self.screen, color, (int(tip_x), int(tip_y)), (int(wing2_x), int(wing2_y)), 1)
-
-    def _draw_crosshair(self, x: int, y: int, size: int = 5, color: Tuple[int, int, int] = (255, 0, 0)) -> None:
         """Draw a crosshair at (x, y). size if half-length of crosshair lines."""
-        if not self.screen:
+        surface = surface or self.screen
+        if not surface:
             return
 
-        pygame.draw.line(
-            self.screen,
-            color,
-            (x - size, y),
-            (x + size, y),
-            1,
-        )
-        pygame.draw.line(
-            self.screen,
-            color,
-            (x, y - size),
-            (x, y + size),
-            1,
-        )
-
-    def _draw_grid(self, parts: int = 4, color: Tuple[int, int, int] = (0, 0, 255)) -> None:
-        """Draw a grid on the screen."""
-        if not self.screen:
+        surface.blit(self._crosshair_sprite(size, color), (x - size, y - size))
+
+    def _crosshair_sprite(self, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Return a cached crosshair of the given half-length and color, to be blitted at (x - size, y - size)."""
+        key = (size, tuple(color))
+        sprite = self._crosshair_sprites.get(key)
+        if sprite is None:
+            span = 2 * size
+            sprite = pygame.Surface((span + 1, span + 1))
+            # The background must differ from the crosshair color to be keyed out
+            background = (0, 0, 0) if key[1] != (0, 0, 0) else (255, 255, 255)
+            sprite.fill(background)
+            pygame.draw.line(sprite, color, (0, size), (span, size), 1)
+            pygame.draw.line(sprite, color, (size, 0), (size, span), 1)
+            sprite.set_colorkey(background, pygame.RLEACCEL)
+            sprite = sprite.convert()
+            self._crosshair_sprites[key] = sprite
+        return sprite
+
+    def _draw_grid(
+        self, parts: int = 4, color: Tuple[int, int, int] = (0, 0, 255), surface: Optional[pygame.Surface] = None
+    ) -> None:
+        """Draw a grid on the screen (or on the given surface)."""
+        surface = surface or self.screen
+        if not surface:
             return
 
-        width = self.config.screen_width
-        height = self.config.screen_height
-
+        # The grid only depends on these, so it is drawn once and blitted
+        key = (self.config.screen_width, self.config.screen_height, parts, color)
+        if key != self._grid_key:
+            self._grid_surface = self._build_grid_surface(*key)
+            self._grid_key = key
+        surface.blit(self._grid_surface, (0, 0))
+
+    @staticmethod
+    def _build_grid_surface(width: int, height: int, parts: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Draw grid lines onto a new surface whose black background is transparent."""
+        surface = pygame.Surface((width, height))
         spacing_w = width // parts
         spacing_h = height // parts
         for x in range(0, width, spacing_w):
-            pygame.draw.line(self.screen, color, (x, 0), (x, height), 1)
+            pygame.draw.line(surface, color, (x, 0), (x, height), 1)
         for y in range(0, height, spacing_h):
-            pygame.draw.line(self.screen, color, (0, y), (width, y), 1)
+            pygame.draw.line(surface, color, (0, y), (width, y), 1)
 
         # Draw lines at the right and bottom edges
-        pygame.draw.line(self.screen, color, (width - 1, 0), (width - 1, height), 1)
-        pygame.draw.line(self.screen, color, (0, height - 1), (width, height - 1), 1)
+        pygame.draw.line(surface, color, (width - 1, 0), (width - 1, height), 1)
+        pygame.draw.line(surface, color, (0, height - 1), (width, height - 1), 1)
+
+        # RLE makes blitting the mostly empty surface cheap
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return surface.convert()
+
+    @staticmethod
+    def _arrow_segments(
+        width: int, height: int, target_x: int, target_y: int, spacing: int = _LOCATOR_SPACING
+    ) -> np.ndarray:
+        """Compute the line segments of a grid of arrows pointing toward (target_x, target_y).
+
+        Arrows sit every `spacing` pixels; each one is a shaft plus two head wings.
+        Returns an int array of shape (N, 3, 2, 2): arrow, segment, start/end point, x/y.
+        """
+        grid_x, grid_y = np.meshgrid(
+            np.arange(spacing, width, spacing, dtype=float),
+            np.arange(spacing, height, spacing, dtype=float),
+            indexing="ij",
+        )
+        x = grid_x.ravel()
+        y = grid_y.ravel()
+
+        # Unit direction to the target; grid points within a pixel of the target get no arrow.
+        # sqrt and division (not hypot or a reciprocal) round exactly like the per-arrow math,
+        # so the truncated end points match pygame.draw.line calls on the same coordinates.
+        dx = target_x - x
+        dy = target_y - y
+        dist = np.sqrt(dx * dx + dy * dy)
+        keep = dist >= 1
+        x, y, dist = x[keep], y[keep], dist[keep]
+        dx = dx[keep] / dist
+        dy = dy[keep] / dist
+
+        # Arrow tip is at (x, y), base is behind it; wings are perpendicular to the shaft
+        tip_x = x + dx * _ARROW_HALF
+        tip_y = y + dy * _ARROW_HALF
+        base_x = x - dx * _ARROW_HALF
+        base_y = y - dy * _ARROW_HALF
+        wing1_x = tip_x - dx * _ARROW_WING - dy * _ARROW_WING
+        wing1_y = tip_y - dy * _ARROW_WING + dx * _ARROW_WING
+        wing2_x = tip_x - dx * _ARROW_WING + dy * _ARROW_WING
+        wing2_y = tip_y - dy * _ARROW_WING - dx * _ARROW_WING
+
+        tip = np.stack([tip_x, tip_y], axis=-1)
+        segments = np.stack([
+            np.stack([np.stack([base_x, base_y], axis=-1), tip], axis=1),
+            np.stack([tip, np.stack([wing1_x, wing1_y], axis=-1)], axis=1),
+            np.stack([tip, np.stack([wing2_x, wing2_y], axis=-1)], axis=1),
+        ], axis=1)
+        return segments.astype(int)  # truncates toward zero like int()
+
+    def _build_locator_surface(self, width: int, height: int, target_x: int, target_y: int) -> pygame.Surface:
+        """Draw the static locator screen (grid, target crosshair, arrow field) onto a new surface."""
+        surface = pygame.Surface((width, height))
+        self._draw_grid(surface=surface)
+        self._draw_crosshair(target_x, target_y, surface=surface)
+
+        segments = self._arrow_segments(width, height, target_x, target_y).reshape(-1, 2, 2)
+        self._rasterize_segments(surface, segments, (255, 255, 255))
+        return surface.convert()
+
+    @staticmethod
+    def _rasterize_segments(surface: pygame.Surface, segments: np.ndarray, color: Tuple[int, int, int]) -> None:
+        """Draw 1 pixel wide line segments by writing directly into the surface's pixel array.
+
+        `segments` is an int array of shape (N, 2, 2): segment, start/end point, x/y.
+        Runs the same integer Bresenham stepping as pygame.draw.line, advancing all
+        segments together, so the Python loop only runs once per pixel of the longest
+        segment instead of once per segment.
+        """
+        x, y = segments[:, 0, 0].copy(), segments[:, 0, 1].copy()
+        x2, y2 = segments[:, 1, 0], segments[:, 1, 1]
+        dx, dy = np.abs(x2 - x), np.abs(y2 - y)
+        sx, sy = np.where(x < x2, 1, -1), np.where(y < y2, 1, -1)
+        err = np.where(dx > dy, dx, -dy)
+        err = np.sign(err) * (np.abs(err) // 2)  # C integer division truncates toward zero
+
+        xs, ys = [x.copy()], [y.copy()]
+        for _ in range(int(np.maximum(dx, dy).max(initial=0))):
+            active = (x != x2) | (y != y2)
+            step_x = active & (err > -dx)
+            step_y = active & (err < dy)
+            err = err - np.where(step_x, dy, 0) + np.where(step_y, dx, 0)
+            x = x + np.where(step_x, sx, 0)
+            y = y + np.where(step_y, sy, 0)
+            xs.append(x)
+            ys.append(y)
+        xs, ys = np.concatenate(xs), np.concatenate(ys)
+
+        width, height = surface.get_size()
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[xs[inside], ys[inside]] = surface.map_rgb(color)
+        del pixels  # releases the surface lock
 
     def _render_locator(self) -> None:
         """Render the locator screen with arrows pointing to target."""
         if not self.screen:
             return
 
-        self._draw_grid()
-
         width = self.config.screen_width
         height = self.config.screen_height
 
@@ -783,16 +1094,12 @@ class SimulatorDisplay:
         target_x = width - 10 if self.southern_hemisphere else 10
         target_y = int(height * self.config.target_y_ratio)
 
-        self._draw_crosshair(target_x, target_y)
-
-        # Draw arrows on a 20px grid
-        grid_spacing = 20
-        arrow_size = 10
-        arrow_color = (255, 255, 255)
-
-        for x in range(grid_spacing, width, grid_spacing):
-            for y in range(grid_spacing, height, grid_spacing):
-                self._draw_arrow(x, y, target_x, target_y, arrow_size, arrow_color)
+        # The locator screen only depends on these, so it is drawn once and blitted each frame
+        key = (width, height, target_x, target_y)
+        if key != self._locator_key:
+            self._locator_surface = self._build_locator_surface(*key)
+            self._locator_key = key
+        self.screen.blit(self._locator_surface, (0, 0))
 
     def _render_align(self) -> None:
         """Render horizontal lines for alignment. Line at crosshair position is red."""
@@ -808,7 +1115,10 @@ class SimulatorDisplay:
         # Use the same target position as the locator crosshair
         target_y = int(height * self.config.target_y_ratio)
 
-        font = pygame.font.Font(None, 24)
+        screen = self.screen
+        line = pygame.draw.line
+        text_surface = self._text_surface
+        labels = []
 
         # Draw horizontal lines 50px apart, centered on the target_y position
         # Lines above the target
@@ -816,14 +1126,14 @@ class SimulatorDisplay:
         while y >= 0:
             distance = target_y - y
             color = red_color if y == target_y else gray_color
-            pygame.draw.line(self.screen, color, (0, y), (width, y), 1)
+            line(screen, color, (0, y), (width, y), 1)
 
-            # Draw distance labels at both ends
-            label = font.render(str(distance), True, color)
-            # Left side
-            self.screen.blit(label, (5, y - label.get_height() - 2))
-            # Right side
-            self.screen.blit(label, (width - label.get_width() - 5, y - label.get_height() - 2))
+            # Distance labels at both ends, sitting 2px above the line; skip them if that is off-screen
+            if y > 2:
+                label = text_surface(24, str(distance), color)
+                label_y = y - label.get_height() - 2
+                labels.append((label, (5, label_y)))
+                labels.append((label, (width - label.get_width() - 5, label_y)))
 
             y -= line_spacing
 
@@ -831,17 +1141,18 @@ class SimulatorDisplay:
         y = target_y + line_spacing
         while y <= height:
             distance = target_y - y  # Negative for lines below
-            pygame.draw.line(self.screen, gray_color, (0, y), (width, y), 1)
+            line(screen, gray_color, (0, y), (width, y), 1)
 
-            # Draw distance labels at both ends
-            label = font.render(str(distance), True, gray_color)
-            # Left side
-            self.screen.blit(label, (5, y - label.get_height() - 2))
-            # Right side
-            self.screen.blit(label, (width - label.get_width() - 5, y - label.get_height() - 2))
+            # Distance labels at both ends
+            label = text_surface(24, str(distance), gray_color)
+            label_y = y - label.get_height() - 2
+            labels.append((label, (5, label_y)))
+            labels.append((label, (width - label.get_width() - 5, label_y)))
 
             y += line_spacing
 
+        screen.blits(labels, doreturn=False)
+
     def _render_calibration(self) -> None:
         """Render the calibration screen with hover crosshair and collected points."""
         if not self.screen:
@@ -863,17 +1174,24 @@ class SimulatorDisplay:
         if len(self.calibration_points) > 1:
             pygame.draw.lines(self.screen, line_color, False, self.calibration_points, 2)
 
-        # Draw calibration points as crosshairs
+        # Draw calibration points as crosshair sprites, then their number labels, in one batched blit
+        text_surface = self._text_surface
+        point_sprite = self._crosshair_sprite(8, point_color)
+        selected_sprite = self._crosshair_sprite(12, selected_color)
+        selected = self.calibration_selected_index
+        count = len(self.calibration_points)
+        crosshairs = []
+        labels = []
         for i, (px, py) in enumerate(self.calibration_points):
-            is_selected = i == self.calibration_selected_index
-            color = selected_color if is_selected else point_color
-            size = 12 if is_selected else 8
-            self._draw_crosshair(px, py, size=size, color=color)
-            # Draw point number (inverted for SH so #1 is on the right)
-            num = len(self.calibration_points) - i if self.southern_hemisphere else i + 1
-            font = pygame.font.Font(None, 20)
-            label = font.render(str(num), True, color)
-            self.screen.blit(label, (px + 10, py - 10))
+            if i == selected:
+                color, size, sprite = selected_color, 12, selected_sprite
+            else:
+                color, size, sprite = point_color, 8, point_sprite
+            crosshairs.append((sprite, (px - size, py - size)))
+            # Point number (inverted for SH so #1 is on the right)
+            num = count - i if self.southern_hemisphere else i + 1
+            labels.append((text_surface(20, str(num), color), (px + 10, py - 10)))
+        self.screen.blits(crosshairs + labels, doreturn=False)
 
         # Draw hover crosshair (larger than point markers)
         if self.calibration_hover_position:
@@ -881,20 +1199,13 @@ class SimulatorDisplay:
             self._draw_crosshair(hx, hy, size=15, color=hover_color)
 
         # Display point count and instructions
-        font = pygame.font.Font(None, 36)
-        text = font.render(
-            _("Calibration - Points: %d") % len(self.calibration_points), True, (255, 255, 255)
-        )
+        text = self._text_surface(36, _("Calibration - Points: %d") % len(self.calibration_points), (255, 255, 255))
         text_rect = text.get_rect(center=(width // 2, 30))
         self.screen.blit(text, text_rect)
 
         # Instructions at bottom
-        font_small = pygame.font.Font(None, 28)
-        instr = font_small.render(
-            _("Move mouse on web UI to position crosshair, click to record point"), True, (200, 200, 200)
-        )
-        instr_rect = instr.get_rect(center=(width // 2, height - 30))
-        self.screen.blit(instr, instr_rect)
+        instr_rect = self._cal_instructions.get_rect(center=(width // 2, height - 30))
+        self.screen.blit(self._cal_instructions, instr_rect)
 
     def _render_velocity_measure(self) -> None:
         """Render the velocity measurement screen with three vertical stripes."""
@@ -906,38 +1217,13 @@ class SimulatorDisplay:
 
         # Draw the fitted ellipse trace from calibration as reference (dim)
         if self.calibration_ellipse and "coeffs" in self.calibration_ellipse:
-            A, B, C, D, E, F = self.calibration_ellipse["coeffs"]
-            center_y = self.calibration_ellipse.get("center_y", 0)
-
-            # Determine which arc to use based on calibration points
-            if self.calibration_points:
-                points_above = sum(1 for p in self.calibration_points if p[1] < center_y)
-                use_upper_arc = points_above > len(self.calibration_points) / 2
-            else:
-                use_upper_arc = True
-
-            # Draw ellipse trace (dim gray)
-            pygame.draw.aaline  # for smoother line
-            prev_point = None
-            for x in range(0, width, 2):
-                qa = C
-                qb = B * x + E
-                qc = A * x * x + D * x + F
-                discriminant = qb * qb - 4 * qa * qc
-
-                if discriminant >= 0 and abs(qa) > 1e-10:
-                    sqrt_disc = math.sqrt(discriminant)
-                    y1 = (-qb + sqrt_disc) / (2 * qa)
-                    y2 = (-qb - sqrt_disc) / (2 * qa)
-                    y = min(y1, y2) if use_upper_arc else max(y1, y2)
-
-                    if 0 <= y <= height:
-                        current_point = (int(x), int(y))
-                        if prev_point:
-                            pygame.draw.line(self.screen, (40, 40, 40), prev_point, current_point, 1)
-                        prev_point = current_point
-                else:
-                    prev_point = None
+            # Draw ellipse trace (dim gray); its polylines only change with the ellipse or screen size
+            key = (tuple(self.calibration_ellipse["coeffs"]), width, height, self._use_upper_arc())
+            if key != self._trace_key:
+                self._trace_runs = self._ellipse_trace_runs(*key)
+                self._trace_key = key
+            for run in self._trace_runs:
+                pygame.draw.lines(self.screen, (40, 40, 40), False, run, 1)
 
         stripe_width = int(self.velocity_stripe_width)
         if stripe_width < 50:
@@ -960,27 +1246,16 @@ class SimulatorDisplay:
         # Stripe color (gray for B/W camera)
         stripe_color = (200, 200, 200)
 
-        # Small font for labels, so it can be read in guidescope image
-        font_small = pygame.font.Font(None, 12)
+        screen = self.screen
 
         for i, (left_edge, base_label) in enumerate(zip(stripe_left_edges, stripe_base_labels)):
             # Draw vertical stripe
             rect = pygame.Rect(left_edge, 0, stripe_width, height)
-            pygame.draw.rect(self.screen, stripe_color, rect)
-
-            # Calculate how many repetitions needed to fill screen height
-            # Render single label to measure its width (becomes height when rotated)
-            single_surface = font_small.render(base_label, True, stripe_color)
-            single_width = single_surface.get_width()
-            # Calculate repetitions needed to fill height, add 1 to ensure full coverage
-            repetitions = (height // single_width) + 1
-            label = base_label * repetitions
+            pygame.draw.rect(screen, stripe_color, rect)
 
             # Draw label next to stripe, rotated to read bottom-to-top
             # 10 pixel gap between stripe and text
-            label_surface = font_small.render(label, True, stripe_color)
-            # Rotate 90 degrees counter-clockwise (text reads bottom to top)
-            rotated_label = pygame.transform.rotate(label_surface, 90)
+            rotated_label = self._stripe_label(base_label, height, stripe_color)
 
             if i == 0:  # LEFT stripe - label to the right of stripe
                 label_x = left_edge + stripe_width + 10
@@ -991,13 +1266,89 @@ class SimulatorDisplay:
             else:  # MIDDLE stripe - label to the right of stripe
                 label_x = left_edge + stripe_width + 10
                 label_rect = rotated_label.get_rect(left=label_x, bottom=height)
-            self.screen.blit(rotated_label, label_rect)
+            screen.blit(rotated_label, label_rect)
+
+    def _stripe_label(self, base_label: str, height: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Return the label repeated to fill the screen height, rotated to read bottom-to-top.
+
+        Built once per label, height and color; the velocity screen blits it every frame.
+        """
+        key = (base_label, height, color)
+        surface = self._stripe_labels.get(key)
+        if surface is None:
+            # Small font for labels, so it can be read in guidescope image
+            font_small = self._fonts[12]
+            # Calculate how many repetitions needed to fill screen height
+            # Measure a single label's width (becomes height when rotated)
+            single_width = font_small.size(base_label)[0]
+            # Calculate repetitions needed to fill height, add 1 to ensure full coverage
+            repetitions = (height // single_width) + 1
+            label_surface = font_small.render(base_label * repetitions, True, color)
+            # Rotate 90 degrees counter-clockwise (text reads bottom to top)
+            surface = pygame.transform.rotate(label_surface, 90).convert_alpha()
+            self._stripe_labels[key] = surface
+        return surface
+
+    @staticmethod
+    def _ellipse_trace_runs(
+        coeffs: Sequence[float], width: int, height: int, use_upper_arc: bool
+    ) -> List[List[List[int]]]:
+        """Sample the ellipse every 2 pixels in x on one arc and return the on-screen polylines.
+
+        The trace breaks where the ellipse has no point at that x.
+        """
+        xs = np.arange(0, width, 2, dtype=float)
+        ys = _ellipse_ys(coeffs, xs, use_upper_arc)
+        solvable = ~np.isnan(ys)
+        visible = solvable & (ys >= 0) & (ys <= height)
+        run_ids = np.cumsum(~solvable)[visible]
+        points = np.column_stack([xs[visible], ys[visible]]).astype(int)
+        runs = []
+        for run in np.split(points, np.flatnonzero(np.diff(run_ids)) + 1):
+            if len(run) > 1:
+                # Drop points in the middle of horizontal stretches: one segment draws the same pixels
+                run_ys = run[:, 1]
+                keep = np.ones(len(run), dtype=bool)
+                keep[1:-1] = (run_ys[1:-1] != run_ys[:-2]) | (run_ys[1:-1] != run_ys[2:])
+                runs.append(run[keep].tolist())
+        return runs
+
+    def _draw_star(self, star_x: float, star_y: float) -> Optional[pygame.Rect]:
+        """Draw the star as a 2D Gaussian distribution with subpixel accuracy.
+
+        sigma = FWHM / (2 * sqrt(2 * ln(2))) ≈ FWHM / 2.355; pixels within 3*sigma
+        (plus one) of the star are computed as one NumPy patch and blended onto the screen.
+        Returns the screen area drawn, or None if the star is off-screen.
+        """
+        config = self.config
+        sigma = config.star_size / 2.355
+        radius = int(3 * sigma) + 1
+
+        # Bounding box of pixels to render, clipped to the screen
+        px_min = max(int(star_x) - radius, 0)
+        px_max = min(int(star_x) + radius + 2, config.screen_width)
+        py_min = max(int(star_y) - radius, 0)
+        py_max = min(int(star_y) + radius + 2, config.screen_height)
+        if px_min >= px_max or py_min >= py_max:
+            return None
+
+        # The Gaussian is separable: one exp() per column and per row, combined as an (x, y) outer product
+        falloff = -1 / (2 * sigma * sigma)
+        dist_x = np.arange(px_min, px_max) - star_x
+        dist_y = np.arange(py_min, py_max) - star_y
+        gauss_x = np.exp(dist_x * dist_x * falloff)
+        gauss_y = config.star_brightness * np.exp(dist_y * dist_y * falloff)
+        gray = np.clip(gauss_x[:, None] * gauss_y[None, :], 0, 255).astype(np.uint8)
+
+        patch = pygame.surfarray.make_surface(np.repeat(gray[:, :, None], 3, axis=2))
+        return self.screen.blit(patch, (px_min, py_min), special_flags=pygame.BLEND_RGB_MAX)
 
     def _render_simulation(self) -> None:
         """Render the simulated star moving along the ellipse curve."""
         if not self.screen:
             return
 
+        screen = self.screen
         width = self.config.screen_width
         height = self.config.screen_height
 
@@ -1009,86 +1360,73 @@ class SimulatorDisplay:
         # Check timing and play warning beeps
         self._check_and_play_beeps(status["remaining_seconds"], status["complete"])
 
-        start = time.time()
-        # Draw the star as a 2D Gaussian distribution with subpixel accuracy
-        # sigma = FWHM / (2 * sqrt(2 * ln(2))) ≈ FWHM / 2.355
+        # Only the star and the status texts change between frames: clear what was drawn
+        # last frame instead of the whole screen, and update just those areas
+        previous = self._sim_rects
+        if previous is None:
+            screen.fill((0, 0, 0))
+        else:
+            for rect in previous:
+                screen.fill((0, 0, 0), rect)
+        drawn: List[pygame.Rect] = []
+
+        start = _now()
         if self.calibration_ellipse and 0 <= current_y <= height:
-            fwhm = self.config.star_size
-            sigma = fwhm / 2.355
-            max_brightness = self.config.star_brightness
-
-            # Draw pixels in a region around the star (3*sigma is enough to capture most of the light)
-            radius = int(3 * sigma) + 1
-            # Calculate the bounding box of pixels to render
-            px_min = int(current_x) - radius
-            px_max = int(current_x) + radius + 1
-            py_min = int(current_y) - radius
-            py_max = int(current_y) + radius + 1
-
-            for py in range(py_min, py_max + 1):
-                for px in range(px_min, px_max + 1):
-                    # Skip if outside screen
-                    if px < 0 or px >= width or py < 0 or py >= height:
-                        continue
-
-                    # Calculate distance from pixel center to star position (subpixel accuracy)
-                    dist_x = px - current_x
-                    dist_y = py - current_y
-                    dist_sq = dist_x * dist_x + dist_y * dist_y
-                    brightness = max_brightness * math.exp(-dist_sq / (2 * sigma * sigma))
-
-                    if brightness >= 1:  # Only draw if brightness is visible
-                        gray = int(brightness)
-                        self.screen.set_at((px, py), (gray, gray, gray))
-        end = time.time()
+            star_rect = self._draw_star(current_x, current_y)
+            if star_rect:
+                drawn.append(star_rect)
+        end = _now()
         self.simu_render = end - start
 
-        # Draw status info at top - large font for visibility from distance
-        font_status = pygame.font.Font(None, 72)
-        font_time = pygame.font.Font(None, 200)  # Very large for time remaining
+        # Draw status info at top - large font for visibility from distance. The fixed status texts
+        # come from the text cache; the countdown is re-rendered only when its text changes.
+        text_surface = self._text_surface
         if status["complete"]:
-            text = font_status.render(_("Simulation Complete"), True, (0, 255, 0))
+            text = text_surface(72, _("Simulation Complete"), (0, 255, 0))
             text_rect = text.get_rect(center=(width // 2, 50))
-            self.screen.blit(text, text_rect)
+            drawn.append(screen.blit(text, text_rect))
         elif status["running"]:
             remaining = status["remaining_seconds"]
             mins = int(remaining // 60)
             secs = int(remaining % 60)
             # Draw "Running" label
-            label = font_status.render(_("Running"), True, (255, 255, 0))
+            label = text_surface(72, _("Running"), (255, 255, 0))
             label_rect = label.get_rect(center=(width // 2, 40))
-            self.screen.blit(label, label_rect)
-            # Draw large time remaining
-            time_text = font_time.render(f"{mins:02d}:{secs:02d}", True, (255, 255, 0))
+            drawn.append(screen.blit(label, label_rect))
+            # Draw large time remaining, very large font
+            countdown = f"{mins:02d}:{secs:02d}"
+            if countdown != self._countdown_text:
+                self._countdown_surface = self._fonts[200].render(countdown, True, (255, 255, 0)).convert_alpha()
+                self._countdown_text = countdown
+            time_text = self._countdown_surface
             time_rect = time_text.get_rect(center=(width // 2, 130))
-            self.screen.blit(time_text, time_rect)
+            drawn.append(screen.blit(time_text, time_rect))
         else:
-            text = font_status.render(_("Simulation Ready - Press Start"), True, (200, 200, 200))
+            text = text_surface(72, _("Simulation Ready - Press Start"), (200, 200, 200))
             text_rect = text.get_rect(center=(width // 2, 50))
-            self.screen.blit(text, text_rect)
+            drawn.append(screen.blit(text, text_rect))
 
         if self.simulation_velocity_source == "calculated":
-            font_warn = pygame.font.Font(None, 48)
-            warn_text = font_warn.render(
-                _("Velocity not measured \u2014 using estimated rate"), True, (255, 180, 0)
-            )
+            warn_text = text_surface(48, _("Velocity not measured \u2014 using estimated rate"), (255, 180, 0))
             warn_rect = warn_text.get_rect(center=(width // 2, height - 40))
-            self.screen.blit(warn_text, warn_rect)
+            drawn.append(screen.blit(warn_text, warn_rect))
         elif self.simulation_velocity_source == "measured_average":
-            font_warn = pygame.font.Font(None, 48)
-            warn_text = font_warn.render(
-                _("Velocity partially measured \u2014 using average"), True, (255, 200, 0)
-            )
+            warn_text = text_surface(48, _("Velocity partially measured \u2014 using average"), (255, 200, 0))
             warn_rect = warn_text.get_rect(center=(width // 2, height - 40))
-            self.screen.blit(warn_text, warn_rect)
+            drawn.append(screen.blit(warn_text, warn_rect))
 
-        font_small = pygame.font.Font(None, 24)
-        # Draw FPS in top-right corner
+        # Draw FPS in top-right corner (changes every frame, so it is not cached)
         if self.clock:
             fps = self.clock.get_fps()
-            fps_text = font_small.render(f"{fps:.1f} fps ({self.simu_render:.3f}s)", True, (200, 200, 200))
+            fps_text = self._fonts[24].render(f"{fps:.1f} fps ({self.simu_render:.3f}s)", True, (200, 200, 200))
             fps_rect = fps_text.get_rect(topright=(width - 10, 10))
-            self.screen.blit(fps_text, fps_rect)
+            drawn.append(screen.blit(fps_text, fps_rect))
+
+        self._sim_rects = drawn
+        if previous is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(previous + drawn)
 
     def quit(self) -> None:
         """Cleanup and quit pygame."""
@@ -5,6 +5,9 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
 import yaml
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+SIDEREAL_RATE = 15.041  # arcsec/sec
 
 
 def load_config(config_file: str | None = None) -> dict:
@@ -141,6 +144,102 @@ def rotate(v, axis, angle):
     return v * math.cos(angle) + np.cross(axis, v) * math.sin(angle) + axis * np.dot(axis, v) * (1 - math.cos(angle))
 
 
+def rotate_batch(v, axis, angles):
+    """Rotate v around axis by each of angles (radians), returning an (N, 3) array."""
+    axis = np.asarray(axis, dtype=float)
+    # ensure unit vector
+    if abs(np.linalg.norm(axis) - 1.0) > 1e-3:
+        axis = axis / np.linalg.norm(axis)
+
+    v = np.asarray(v, dtype=float)
+    angles = np.asarray(angles, dtype=float)
+    cos_a = np.cos(angles)[:, None]
+    sin_a = np.sin(angles)[:, None]
+
+    return v * cos_a + np.cross(axis, v) * sin_a + axis * np.dot(axis, v) * (1 - cos_a)
+
+
+def mount_vectors(lat, offset, dec=None):
+    """Return the rotation axis, telescope offset and line-of-sight direction (lat and dec in radians)."""
+    # Coordinate system: x in direction of observer, y in direction of screen, z up to the ceiling
+
+    # Rotation Axis of the telescope (unit vector)
+    rot_axis = np.array((0, math.cos(lat), -math.sin(lat)))
+
+    # Telescope is affixed off-axis to mount
+    #  - First component of offset vector is offset from RA-axis (in direction of observer)
+    #  - Second component is offset from Dec axis, which is zero here (negative is in direction of floor)
+    o = np.array((offset[0], offset[1], 0))
+
+    # Line of sight direction
+    # if lat+dec = 90°, pointing straight to the screen.
+    d = np.array((0, 1, 0))
+    if dec is not None:
+        d = np.array((0, math.cos(math.radians(90) - lat + dec), math.sin(math.radians(90) - lat + dec)))
+
+    return rot_axis, o, d
+
+
+def screen_plane(rot_axis, o, d, start, stop, distance):
+    """Place the screen at distance along the line of sight of the middle angle (start and stop in degrees).
+
+    Returns the screen center, its normal and the horizontal and vertical unit vectors in the screen.
+    """
+    # Line of sight for middle angle direction
+    mid_angle = math.radians((start + stop) / 2)
+    o_mid = rotate(o, rot_axis, mid_angle)
+    d_mid = rotate(d, rot_axis, mid_angle)
+
+    # Rectangle center at distance from origin along the line
+    rect_center = o_mid + distance * d_mid
+
+    # Find two perpendicular vectors to d_mid for the rectangle plane
+    # Use cross product with z-axis to get first perpendicular
+    perp1 = np.cross(d_mid, np.array((0.0, 0.0, 1.0)))
+    perp1 = perp1 / np.linalg.norm(perp1)
+    # Second perpendicular is cross of d_mid and perp1
+    perp2 = np.cross(perp1, d_mid)
+    perp2 = perp2 / np.linalg.norm(perp2)
+
+    return rect_center, d_mid, perp1, perp2
+
+
+def compute_intersections(lat, offset, dec, start, stop, distance, n=200):
+    """Intersect the lines of sight for n angles from start to stop with the screen.
+
+    lat, dec (or None), start and stop are in degrees; offset is the (RA, Dec) telescope offset and
+    distance the distance to the screen, both in m. Returns the screen x and y (m) of each intersection
+    and an (N - 1, 2) array of the x/y velocity (mm/s) between neighbouring samples at sidereal rate.
+    """
+    rot_axis, o, d = mount_vectors(math.radians(lat), offset, math.radians(dec) if dec is not None else None)
+    rect_center, d_mid, perp1, perp2 = screen_plane(rot_axis, o, d, start, stop, distance)
+
+    # Plane defined by: (P - rect_center) · d_mid = 0
+    angles = np.radians(np.linspace(start, stop, n))
+    o_rots = rotate_batch(o, rot_axis, angles)
+    d_rots = rotate_batch(d, rot_axis, angles)
+
+    # Find intersection: t = (rect_center - o_rot) · d_mid / (d_rot · d_mid)
+    denom = d_rots @ d_mid
+    valid = np.abs(denom) > 1e-10  # avoid division by zero
+    o_rots, d_rots, denom = o_rots[valid], d_rots[valid], denom[valid]
+    t_vals = ((rect_center - o_rots) @ d_mid) / denom
+    intersections = o_rots + t_vals[:, None] * d_rots
+
+    # Project onto perp1/perp2 coordinate system
+    rel = intersections - rect_center
+    xs = rel @ perp1
+    ys = rel @ perp2
+
+    # Calculate velocity assuming an angular velocity of 15 arcsec/sec for rotation around rot_axis.
+    # The cosine for dec is already accounted for by the simulation of lines of sights on the screen.
+    angular_step_arcsec = abs(stop - start) / (len(xs) - 1) * 3600
+    time_per_step_s = angular_step_arcsec / SIDEREAL_RATE
+    velocities = np.column_stack((np.diff(xs), np.diff(ys))) / time_per_step_s * 1000.0
+
+    return xs, ys, velocities
+
+
 def main():
     ########
     # Preparations
@@ -160,28 +259,12 @@ def main():
         f" Start: {args.start}°, Stop: {args.stop}°{dec_str}"
     )
 
-    lat = math.radians(args.lat)
     dec = math.radians(args.dec) if args.dec is not None else None
+    offset = (args.offsetRA, args.offsetDec)
+    rot_axis, o, d = mount_vectors(math.radians(args.lat), offset, dec)
 
-    # Coordinate system: x in direction of observer, y in direction of screen, z up to the ceiling
-
-    # Rotation Axis of the telescope (unit vector)
-    rot_axis = np.array((0, math.cos(lat), -math.sin(lat)))
-
-    # Telescope is affixed off-axis to mount
-    #  - First component of offset vector is offset from RA-axis (in direction of observer)
-    #  - Second component is offset from Dec axis, which is zero here (negative is in direction of floor)
-    o = np.array((args.offsetRA, args.offsetDec, 0))
-
-    # Line of sight direction
-    # if lat+dec = 90°, pointing straight to the screen.
-    d = np.array((0, 1, 0))
-    if dec is not None:
-        d = np.array((0, math.cos(math.radians(90) - lat + dec), math.sin(math.radians(90) - lat + dec)))
-
-    # Parameter range for drawing each line (one directional only, starting at Dec axis position)
+    # Length of each drawn line (one directional only, starting at Dec axis position)
     r = args.distance
-    t = np.linspace(0, r, 100)
 
     fig = plt.figure()
     ax = fig.add_subplot(111, projection="3d")
@@ -194,51 +277,27 @@ def main():
     ax.scatter(0, 0, 0, color="black", label="Origin")
 
     # Plot position of telescope (center of gravity, if optimally balanced)
-    for deg in range(0, 361, 5):
-        angle = math.radians(deg)
+    full_turn = np.radians(np.arange(0, 361, 5))
+    o_turn = rotate_batch(o, rot_axis, full_turn)
 
-        # Rotate offset and direction
-        o_rot = rotate(o, rot_axis, angle)
-        d_rot = rotate(d, rot_axis, angle)
-
-        # Plot the rotated offset point
-        ax.scatter(o_rot[0], o_rot[1], o_rot[2], color="red", s=10)
-
-    # Plot line of sight for the range of angles specified
+    # Line of sight for the range of angles specified
     start_angle = args.start
     stop_angle = args.stop
-    for deg in np.linspace(start_angle, stop_angle, 100):
-        angle = math.radians(deg)
-
-        # Rotate offset and direction
-        o_rot = rotate(o, rot_axis, angle)
-        d_rot = rotate(d, rot_axis, angle)
+    sight_angles = np.radians(np.linspace(start_angle, stop_angle, 100))
+    o_rots = rotate_batch(o, rot_axis, sight_angles)
+    d_rots = rotate_batch(d, rot_axis, sight_angles)
 
-        # Create points of rotated line
-        points = o_rot - t[:, None] * d_rot
+    # Plot the rotated offset points
+    offset_points = np.vstack((o_turn, o_rots))
+    ax.scatter(offset_points[:, 0], offset_points[:, 1], offset_points[:, 2], color="red", s=10)
 
-        # Plot the rotated offset point
-        ax.scatter(o_rot[0], o_rot[1], o_rot[2], color="red", s=10)
-
-        # Plot the rotated line
-        ax.plot(points[:, 0], points[:, 1], points[:, 2], alpha=0.8)
-
-    # Line of sight for middle angle direction
-    mid_angle = math.radians((start_angle + stop_angle) / 2)
-    o_mid = rotate(o, rot_axis, mid_angle)
-    d_mid = rotate(d, rot_axis, mid_angle)
+    # Plot the rotated lines, cycling through the default colors like individual plot calls would
+    segments = np.stack((o_rots, o_rots - r * d_rots), axis=1)
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    ax.add_collection3d(Line3DCollection(segments, colors=colors, alpha=0.8))
 
     distance = -args.distance
-    # Rectangle center at distance 3.8 from origin along the line
-    rect_center = o_mid + distance * d_mid
-
-    # Find two perpendicular vectors to d_mid for the rectangle plane
-    # Use cross product with z-axis to get first perpendicular
-    perp1 = np.cross(d_mid, np.array((0.0, 0.0, 1.0)))
-    perp1 = perp1 / np.linalg.norm(perp1)
-    # Second perpendicular is cross of d_mid and perp1
-    perp2 = np.cross(perp1, d_mid)
-    perp2 = perp2 / np.linalg.norm(perp2)
+    rect_center, _, perp1, perp2 = screen_plane(rot_axis, o, d, start_angle, stop_angle, distance)
 
     # Rectangle dimensions (from setup.yml or command-line overrides)
     width, height = args.screen_width, args.screen_height
@@ -267,27 +326,9 @@ def main():
     fig2, (ax2, ax3, ax4) = plt.subplots(3, 1, figsize=(6, 10))
 
     # Calculate intersections of lines with the screen plane
-    # Plane defined by: (P - rect_center) · d_mid = 0
-    intersections_x = []
-    intersections_y = []
-
-    for deg in np.linspace(start_angle, stop_angle, 200):
-        angle = math.radians(deg)
-        o_rot = rotate(o, rot_axis, angle)
-        d_rot = rotate(d, rot_axis, angle)
-
-        # Find intersection: t = (rect_center - o_rot) · d_mid / (d_rot · d_mid)
-        denom = np.dot(d_rot, d_mid)
-        if abs(denom) > 1e-10:  # avoid division by zero
-            t_val = np.dot(rect_center - o_rot, d_mid) / denom
-            intersection = o_rot + t_val * d_rot
-
-            # Project onto perp1/perp2 coordinate system
-            rel = intersection - rect_center
-            x = np.dot(rel, perp1)
-            y = np.dot(rel, perp2)
-            intersections_x.append(x)
-            intersections_y.append(y)
+    intersections_x, intersections_y, velocities = compute_intersections(
+        args.lat, offset, args.dec, start_angle, stop_angle, distance
+    )
 
     # Plot Intersections
     ax2.plot(intersections_x, intersections_y, "b.-")
@@ -297,32 +338,16 @@ def main():
     ax2.set_aspect("equal")
     ax2.grid(True)
 
-    # Calculate segment lengths and x displacements
-    segment_lengths = []
-    x_displacements = []
-    for i in range(1, len(intersections_x)):
-        dx = intersections_x[i] - intersections_x[i - 1]
-        dy = intersections_y[i] - intersections_y[i - 1]
-        x_displacements.append(dx)
-        segment_lengths.append(math.sqrt(dx * dx + dy * dy))
-
-    # Calculate velocity assuming an angular velocity of 15 arcsec/sec for rotation around rot_axis.
-    # The cosine for dec is already accounted for by the simulation of lines of sights on the screen.
-    n_samples = len(intersections_x)
-    angular_step_deg = abs(stop_angle - start_angle) / (n_samples - 1)
-    angular_step_arcsec = angular_step_deg * 3600
-    sidereal_rate = 15.041  # arcsec/sec
-    time_per_step_s = angular_step_arcsec / sidereal_rate
-    velocities_mm_s = [length / time_per_step_s * 1000.0 for length in segment_lengths]
-    x_velocities_mm_s = [dx / time_per_step_s * 1000.0 for dx in x_displacements]
+    velocities_mm_s = np.hypot(velocities[:, 0], velocities[:, 1])
+    x_velocities_mm_s = velocities[:, 0]
 
     # Convert X velocity to px/s using screen configuration
     pixels_per_mm = args.screen_width_px / args.screen_width_mm
-    x_velocities_px_s = [v * pixels_per_mm for v in x_velocities_mm_s]
+    x_velocities_px_s = x_velocities_mm_s * pixels_per_mm
 
     # Create percentage x-axis (0% to 100%)
     n_velocity_samples = len(velocities_mm_s)
-    percent_x = [i * 100.0 / (n_velocity_samples - 1) for i in range(n_velocity_samples)]
+    percent_x = np.arange(n_velocity_samples) * 100.0 / (n_velocity_samples - 1)
 
     ax3.plot(percent_x, velocities_mm_s, "r.-", label="Total velocity (mm/s)")
 
@@ -330,7 +355,7 @@ def main():
 
     # Calculate and plot sidereal velocity at this distance for comparison
     # Convert to rad/s: 15.041 * (pi/180) / 3600 rad/s
-    sidereal_rate_rad_s = sidereal_rate * math.pi / (180 * 3600)  # rad/s
+    sidereal_rate_rad_s = SIDEREAL_RATE * math.pi / (180 * 3600)  # rad/s
     # Velocity = angular_velocity * distance
     sidereal_velocity_mm_s = sidereal_rate_rad_s * abs(args.distance) * 1000.0 * math.cos(dec if dec is not None else 0)
     ax3.axhline(
@@ -359,14 +384,10 @@ def main():
     ax_tbl.axis("off")
 
     dec_val = f"{args.dec}°" if args.dec is not None else "—"
-    x_span_mm = (max(intersections_x) - min(intersections_x)) * 1000.0
-    y_span_mm = (max(intersections_y) - min(intersections_y)) * 1000.0
-    v_min = min(velocities_mm_s)
-    v_avg = sum(velocities_mm_s) / len(velocities_mm_s)
-    v_max = max(velocities_mm_s)
-    xv_min = min(x_velocities_px_s)
-    xv_avg = sum(x_velocities_px_s) / len(x_velocities_px_s)
-    xv_max = max(x_velocities_px_s)
+    x_span_mm = np.ptp(intersections_x) * 1000.0
+    y_span_mm = np.ptp(intersections_y) * 1000.0
+    v_min, v_avg, v_max = velocities_mm_s.min(), velocities_mm_s.mean(), velocities_mm_s.max()
+    xv_min, xv_avg, xv_max = x_velocities_px_s.min(), x_velocities_px_s.mean(), x_velocities_px_s.max()
 
     rows = [
         # ---- inputs ----
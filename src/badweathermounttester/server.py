@@ -10,7 +10,6 @@ from threading import Event, Thread
 from typing import Optional, Callable, List, Dict
 
 import numpy as np
-import yaml
 from flask import Flask, make_response, render_template, jsonify, request  # , g
 from flask_babel import Babel  # , gettext as _
 from waitress import serve
@@ -43,8 +42,15 @@ def fit_ellipse(points: List[List[int]]) -> Optional[Dict]:
     if len(points) < 5:
         return None
 
-    x = np.array([p[0] for p in points], dtype=float)
-    y = np.array([p[1] for p in points], dtype=float)
+    pts = np.asarray(points, dtype=float)
+    if pts.ndim != 2 or pts.shape[1] < 2:
+        return None
+    # Fit in centered, scaled coordinates: raw pixel coordinates put x² terms around 1e7
+    # into the scatter matrices, which makes the eigenproblem badly conditioned
+    mean_x, mean_y = pts[:, 0].mean(), pts[:, 1].mean()
+    scale = float(np.sqrt(np.mean((pts[:, 0] - mean_x) ** 2 + (pts[:, 1] - mean_y) ** 2))) or 1.0
+    x = (pts[:, 0] - mean_x) / scale
+    y = (pts[:, 1] - mean_y) / scale
 
     try:
         # Build design matrix for general conic: Ax² + Bxy + Cy² + Dx + Ey + F = 0
@@ -56,12 +62,12 @@ def fit_ellipse(points: List[List[int]]) -> Optional[Dict]:
         S2 = D1.T @ D2
         S3 = D2.T @ D2
 
-        # Constraint matrix for ellipse: 4AC - B² > 0
-        C1 = np.array([[0, 0, 2], [0, -1, 0], [2, 0, 0]], dtype=float)
-
-        # Solve the generalized eigenvalue problem
-        S3_inv = np.linalg.inv(S3)
-        M = np.linalg.inv(C1) @ (S1 - S2 @ S3_inv @ S2.T)
+        # Solve the generalized eigenvalue problem. The ellipse constraint matrix
+        # C1 = [[0, 0, 2], [0, -1, 0], [2, 0, 0]] (4AC - B² > 0) has the closed-form
+        # inverse [[0, 0, 1/2], [0, -1, 0], [1/2, 0, 0]], applied here as a row shuffle.
+        T = -np.linalg.solve(S3, S2.T)
+        reduced = S1 + S2 @ T
+        M = np.array([reduced[2] / 2, -reduced[1], reduced[0] / 2])
 
         eigenvalues, eigenvectors = np.linalg.eig(M)
 
@@ -76,11 +82,23 @@ def fit_ellipse(points: List[List[int]]) -> Optional[Dict]:
         # Take the one with smallest positive eigenvalue
         idx = valid_idx[np.argmin(np.abs(eigenvalues[valid_idx]))]
         a1 = eigenvectors[:, idx]
-        a2 = -S3_inv @ S2.T @ a1
-
-        # Coefficients [A, B, C, D, E, F]
-        A, B, C = a1
-        D, E, F = a2
+        a2 = T @ a1
+
+        # Map the conic back to pixel coordinates (x -> (x - mean_x) / scale) and normalize
+        # so that (A, B, C) is a unit vector, as the eigenvector was
+        a, b, c = a1
+        d, e, f = a2
+        s2 = scale * scale
+        coeffs = np.array([
+            a / s2,
+            b / s2,
+            c / s2,
+            d / scale - (2 * a * mean_x + b * mean_y) / s2,
+            e / scale - (2 * c * mean_y + b * mean_x) / s2,
+            f + (a * mean_x * mean_x + b * mean_x * mean_y + c * mean_y * mean_y) / s2
+            - (d * mean_x + e * mean_y) / scale,
+        ])
+        A, B, C, D, E, F = coeffs / np.linalg.norm(coeffs[:3])
 
         # Convert to geometric parameters
         # Center: solve dF/dx = 0, dF/dy = 0
@@ -199,7 +217,7 @@ class WebServer:
         @self.app.route("/config", methods=["GET"])
         def download_config():
             """Return the current configuration as a downloadable YAML text file."""
-            text = yaml.safe_dump(self.config.to_dict(), default_flow_style=False, sort_keys=False)
+            text = self.config.to_yaml()
             response = make_response(text)
             response.headers["Content-Type"] = "text/plain; charset=utf-8"
             response.headers["Content-Disposition"] = "attachment; filename=\"setup.yml\""
@@ -845,8 +863,8 @@ class WebServer:
 
             if velocity_profile is not None:
                 # Compute total time via numerical integration (quadratic polynomial)
-                profile_xs = np.array([p[0] for p in velocity_profile])
-                profile_vs = np.array([p[1] for p in velocity_profile])
+                profile = np.asarray(velocity_profile, dtype=float)
+                profile_xs, profile_vs = profile[:, 0], profile[:, 1]
                 coeffs = np.polyfit(profile_xs, profile_vs, 2)
                 lookup_xs = np.linspace(float(x_start), float(x_end), 1000)
                 lookup_vs = np.maximum(np.polyval(coeffs, lookup_xs), 0.01)
@@ -0,0 +1,39 @@
+"""Tests for application startup helpers."""
+
+import tempfile
+from pathlib import Path
+
+from badweathermounttester.app import load_startup_config
+from badweathermounttester.config import AppConfig
+
+
+def test_load_startup_config_fills_empty_setup_file():
+    """Test that an existing but empty setup file gets the default template written."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        setup_path = Path(tmpdir) / "setup.yml"
+        setup_path.write_text("")
+
+        config = load_startup_config(None, setup_path)
+
+        assert config.server.port == 5050
+        assert "star_brightness" in setup_path.read_text()
+
+
+def test_load_startup_config_priority():
+    """Test that --config wins over --setup, and a missing setup file falls back to defaults unwritten."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.json"
+        setup_path = Path(tmpdir) / "setup.yml"
+        json_config = AppConfig()
+        json_config.server.port = 8080
+        json_config.save(config_path)
+        yaml_config = AppConfig()
+        yaml_config.server.port = 9090
+        yaml_config.save_yaml(setup_path)
+
+        assert load_startup_config(config_path, setup_path).server.port == 8080
+        assert load_startup_config(Path(tmpdir) / "missing.json", setup_path).server.port == 9090
+
+        missing_setup = Path(tmpdir) / "missing.yml"
+        assert load_startup_config(None, missing_setup).server.port == 5050
+        assert not missing_setup.exists()
@@ -1,6 +1,7 @@
 """Tests for configuration handling."""
 
 import json
+import math
 import tempfile
 from pathlib import Path
 
@@ -40,3 +41,126 @@ def test_config_load_nonexistent():
     config = AppConfig.load(Path("/nonexistent/path/config.json"))
     assert config.mount.latitude == 0.0
     assert config.server.port == 5050
+
+
+def test_config_load_yaml_uses_cache_sidecar():
+    """Test that load_yaml writes a JSON sidecar and reuses it while the file is unchanged."""
+    config = AppConfig()
+    config.mount.latitude = 48.1
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        setup_path = Path(tmpdir) / "setup.yml"
+        config.save_yaml(setup_path)
+
+        loaded_config = AppConfig.load_yaml(setup_path)
+        cache_path = Path(tmpdir) / "setup.yml.cache.json"
+        assert loaded_config.mount.latitude == 48.1
+        assert cache_path.exists()
+
+        # Tamper with the cached data: it must be used as long as the source is unchanged
+        cached = json.loads(cache_path.read_text())
+        cached["data"]["mount"]["latitude"] = 12.0
+        cache_path.write_text(json.dumps(cached))
+        assert AppConfig.load_yaml(setup_path).mount.latitude == 12.0
+
+
+def test_config_load_yaml_cache_invalidated_on_change():
+    """Test that editing the YAML file invalidates the JSON sidecar."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        setup_path = Path(tmpdir) / "setup.yml"
+        AppConfig().save_yaml(setup_path)
+        assert AppConfig.load_yaml(setup_path).mount.latitude == 0.0
+
+        config = AppConfig()
+        config.mount.latitude = -33.9
+        config.server.port = 8081
+        config.save_yaml(setup_path)
+
+        loaded_config = AppConfig.load_yaml(setup_path)
+        assert loaded_config.mount.latitude == -33.9
+        assert loaded_config.server.port == 8081
+
+
+def test_config_load_yaml_skips_cache_for_non_finite_values():
+    """Test that .nan/.inf values are read from the YAML each time instead of through the JSON sidecar."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        setup_path = Path(tmpdir) / "setup.yml"
+        setup_path.write_text("mount:\n  latitude: .nan\n  distance_to_screen_m: .inf\n")
+
+        for _ in range(2):
+            config = AppConfig.load_yaml(setup_path)
+            assert math.isnan(config.mount.latitude)
+            assert config.mount.distance_to_screen_m == math.inf
+        assert not (Path(tmpdir) / "setup.yml.cache.json").exists()
+
+
+def test_config_try_load_nonexistent():
+    """Test that try_load and try_load_yaml return None for missing files."""
+    assert AppConfig.try_load(Path("/nonexistent/path/config.json")) is None
+    assert AppConfig.try_load_yaml(Path("/nonexistent/path/setup.yml")) is None
+
+
+def test_config_load_ignores_unknown_keys():
+    """Test that unknown sections and keys in a config file are ignored."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.json"
+        config_path.write_text(json.dumps({
+            "mount": {"latitude": 12.5, "no_such_key": 1},
+            "server": {"apply_screen_size_preset": 2},
+            "no_such_section": {"port": 3},
+        }))
+
+        config = AppConfig.load(config_path)
+
+        assert config.mount.latitude == 12.5
+        assert not hasattr(config.mount, "no_such_key")
+        assert config.server.port == 5050
+
+
+def test_config_load_ignores_non_mapping_documents():
+    """Test that a document or section that is not a mapping falls back to defaults."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.json"
+        for document in ([1, 2, 3], 42, {"mount": [12.5], "server": "port", "display": None}):
+            config_path.write_text(json.dumps(document))
+
+            config = AppConfig.load(config_path)
+
+            assert config.mount.latitude == 0.0
+            assert config.server.port == 5050
+
+        setup_path = Path(tmpdir) / "setup.yml"
+        setup_path.write_text("- mount\n- display\n")
+        assert AppConfig.load_yaml(setup_path).server.port == 5050
+
+
+def test_config_save_yaml_writes_cache_sidecar():
+    """Test that save_yaml refreshes the JSON sidecar so the next load skips YAML parsing."""
+    config = AppConfig()
+    config.calibration.points = [[100, 200], [300, 250]]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        setup_path = Path(tmpdir) / "setup.yml"
+        config.save_yaml(setup_path)
+
+        cached = json.loads((Path(tmpdir) / "setup.yml.cache.json").read_text())
+        assert cached["data"] == config.to_dict()
+
+        loaded_config = AppConfig.load_yaml(setup_path)
+        assert loaded_config.calibration.points == [[100, 200], [300, 250]]
+
+
+def test_config_load_yaml_writes_template_for_missing_or_empty_file():
+    """Test that load_yaml writes a full default template when the setup file is missing or empty."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        setup_path = Path(tmpdir) / "setup.yml"
+        config = AppConfig.load_yaml(setup_path)
+        assert config.server.port == 5050
+        assert "star_brightness" in setup_path.read_text()
+
+        setup_path.write_text("")
+        assert AppConfig.try_load_yaml(setup_path) is None
+        assert setup_path.read_text() == ""
+        config = AppConfig.load_yaml(setup_path)
+        assert config.server.port == 5050
+        assert "star_brightness" in setup_path.read_text()
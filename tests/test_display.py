@@ -0,0 +1,89 @@
+"""Tests for the display helpers."""
+
+import math
+
+import numpy as np
+
+from badweathermounttester.config import DisplayConfig
+from badweathermounttester.display import SimulatorDisplay, _ellipse_y, _ellipse_ys
+
+# Circle of radius 100 around (500, 300): x² + y² - 1000x - 600y + 330000 = 0
+CIRCLE = [1.0, 0.0, 1.0, -1000.0, -600.0, 330000.0]
+
+
+def test_ellipse_y_picks_arc():
+    """Test that the upper arc has the smaller y and points outside the ellipse have none."""
+    assert math.isclose(_ellipse_y(CIRCLE, 500, True), 200)
+    assert math.isclose(_ellipse_y(CIRCLE, 500, False), 400)
+    assert _ellipse_y(CIRCLE, 650, True) is None
+
+
+def test_ellipse_ys_matches_scalar():
+    """Test that the vectorized solver agrees with the scalar one, with NaN where there is no point."""
+    xs = np.arange(350, 660, 10, dtype=float)
+    for use_upper_arc in (True, False):
+        ys = _ellipse_ys(CIRCLE, xs, use_upper_arc)
+        for x, y in zip(xs, ys):
+            expected = _ellipse_y(CIRCLE, x, use_upper_arc)
+            if expected is None:
+                assert np.isnan(y)
+            else:
+                assert math.isclose(y, expected)
+
+
+def test_simulation_time_grid_follows_lookup_tables():
+    """Test that position and velocity lookups match the x/t tables and clamp at both ends."""
+    display = SimulatorDisplay(DisplayConfig())
+    display.setup_simulation(200, 1700, 3.0, [(100, 2.9), (960, 3.1), (1800, 2.8)], "measured_interpolated")
+    total = display.simulation_total_time
+
+    assert display._x_from_elapsed(-1.0) == 200
+    assert math.isclose(display._x_from_elapsed(total + 1.0), 1700)
+    for elapsed in np.linspace(0, total, 37):
+        expected_x = np.interp(elapsed, display.simulation_lookup_ts, display.simulation_lookup_xs)
+        expected_v = np.interp(elapsed, display.simulation_lookup_ts, display.simulation_lookup_vs)
+        assert math.isclose(display._x_from_elapsed(elapsed), expected_x, abs_tol=1e-3)
+        assert math.isclose(display._velocity_at_x(display._x_from_elapsed(elapsed)), expected_v, abs_tol=1e-4)
+
+
+def test_velocity_profile_fit_matches_polyfit():
+    """Test that the quadratic velocity fit agrees with np.polyfit at screen-width x positions."""
+    profile = [(150.0, 2.73), (1920.0, 3.0), (3690.0, 2.4)]
+    display = SimulatorDisplay(DisplayConfig())
+    display.setup_simulation(150, 3690, 3.0, profile, "measured_interpolated")
+
+    xs, vs = zip(*profile)
+    assert np.allclose(display._velocity_coeffs, np.polyfit(xs, vs, 2), rtol=1e-9, atol=0)
+
+
+def test_beeps_once_per_threshold():
+    """Test the 60 s and 30 s warnings and the countdown each beep once, and skipped ones stay silent."""
+    display = SimulatorDisplay(DisplayConfig())
+    display.beep_sound = object()  # any non-None sound enables the checks
+    display.simulation_running = True
+    beeps = []
+    display.play_beep = lambda: beeps.append(remaining)
+
+    for remaining in np.concatenate([np.arange(65, 45, -0.25), np.arange(25.5, 0, -0.25)]):
+        display._check_and_play_beeps(remaining, False)
+
+    assert [math.ceil(r) for r in beeps] == [60, 10, 9, 8, 7, 6, 5, 4, 3, 2]
+
+
+def test_add_calibration_point_keeps_points_sorted():
+    """Test that added points are inserted in x order and their index is returned."""
+    display = SimulatorDisplay(DisplayConfig())
+    display.set_calibration_points([[500, 10], [100, 20], [900, 30]])
+
+    assert display.add_calibration_point(300, 40) == 1
+    assert display.add_calibration_point(500, 50) == 3
+    assert display.calibration_points == [(100, 20), (300, 40), (500, 10), (500, 50), (900, 30)]
+
+
+def test_velocity_setup_marks_screen_dirty():
+    """Test that changing the stripe width forces the skipped velocity screen to redraw."""
+    display = SimulatorDisplay(DisplayConfig())
+    display._dirty = False
+    display.setup_velocity_measurement(0.1)
+    assert display._dirty
+    assert display.get_velocity_stripe_width() == 50
@@ -0,0 +1,30 @@
+"""Tests for the geometry helpers."""
+
+import math
+
+import numpy as np
+
+from badweathermounttester.geometry import SIDEREAL_RATE, compute_intersections, rotate, rotate_batch
+
+
+def test_rotate_batch_matches_rotate():
+    """Test that the batched rotation agrees with rotating one angle at a time."""
+    axis = np.array((0, math.cos(math.radians(51)), -math.sin(math.radians(51))))
+    angles = np.radians(np.linspace(0, -10, 50))
+    for v in ((0.27, -0.015, 0), (0, 1, 0)):
+        expected = np.array([rotate(v, axis, angle) for angle in angles])
+        assert np.allclose(rotate_batch(v, axis, angles), expected)
+
+
+def test_compute_intersections_at_pole():
+    """Test that at the pole the line of sight sweeps horizontally at the sidereal rate times distance."""
+    distance = 3.0
+    xs, ys, velocities = compute_intersections(90.0, (0.0, 0.0), None, 0.0, -1.0, distance, n=101)
+
+    assert len(xs) == len(ys) == 101
+    assert velocities.shape == (100, 2)
+    assert np.allclose(ys, 0.0)
+    assert math.isclose(xs[50], 0.0, abs_tol=1e-12)
+
+    sidereal_mm_s = math.radians(SIDEREAL_RATE / 3600) * distance * 1000.0
+    assert np.allclose(np.abs(velocities[:, 0]), sidereal_mm_s, rtol=1e-3)
@@ -0,0 +1,70 @@
+"""Tests for the web server helpers."""
+
+import math
+
+import numpy as np
+
+from badweathermounttester.config import AppConfig
+from badweathermounttester.server import WebServer, fit_ellipse
+
+
+def test_fit_ellipse_too_few_points():
+    """Test that fewer than five points cannot be fitted."""
+    assert fit_ellipse([[0, 0], [1, 1], [2, 0], [3, 1]]) is None
+
+
+def test_fit_ellipse_recovers_circle():
+    """Test fitting points on a circle returns its center and radius."""
+    points = [
+        [960 + 400 * math.cos(a), 540 + 400 * math.sin(a)]
+        for a in (0.1, 0.4, 0.7, 1.0, 1.3, 1.6, 1.9)
+    ]
+    ellipse = fit_ellipse(points)
+
+    assert ellipse is not None
+    assert math.isclose(ellipse["center_x"], 960, abs_tol=1e-3)
+    assert math.isclose(ellipse["center_y"], 540, abs_tol=1e-3)
+    assert math.isclose(ellipse["semi_major"], 400, abs_tol=1e-3)
+    assert math.isclose(ellipse["semi_minor"], 400, abs_tol=1e-3)
+
+
+def test_fit_ellipse_far_from_origin():
+    """Test that a short arc of a large, offset ellipse is recovered accurately."""
+    cx, cy, a, b, tilt = 3000, 2000, 1500, 300, 0.3
+    points = [
+        [
+            cx + a * math.cos(t) * math.cos(tilt) - b * math.sin(t) * math.sin(tilt),
+            cy + a * math.cos(t) * math.sin(tilt) + b * math.sin(t) * math.cos(tilt),
+        ]
+        for t in (0.3, 0.6, 0.9, 1.2, 1.5, 1.8)
+    ]
+    ellipse = fit_ellipse(points)
+
+    assert ellipse is not None
+    assert math.isclose(ellipse["center_x"], cx, abs_tol=1e-3)
+    assert math.isclose(ellipse["center_y"], cy, abs_tol=1e-3)
+    assert math.isclose(ellipse["semi_major"], a, abs_tol=1e-3)
+    assert math.isclose(ellipse["semi_minor"], b, abs_tol=1e-3)
+
+
+def test_simulation_velocity_matches_polyfit_profile():
+    """Test that the measured velocity profile is integrated along np.polyfit's quadratic at screen-scale x."""
+    config = AppConfig()
+    config.display.screen_width = 3840
+    config.calibration.points = [[150, 900], [1200, 700], [2600, 720], [3700, 950]]
+    config.velocity.stripe_width_pixels = 300
+    config.velocity.left_time_seconds = 110.0
+    config.velocity.middle_time_seconds = 100.0
+    config.velocity.right_time_seconds = 125.0
+
+    response = WebServer(config).app.test_client().get("/api/simulation/velocity")
+    data = response.get_json()
+
+    xs = np.array([150.0, 1920.0, 3690.0])
+    vs = 300 / np.array([110.0, 100.0, 125.0])
+    lookup_xs = np.linspace(150.0, 3700.0, 1000)
+    lookup_vs = np.maximum(np.polyval(np.polyfit(xs, vs, 2), lookup_xs), 0.01)
+    expected = np.sum(np.diff(lookup_xs) / ((lookup_vs[:-1] + lookup_vs[1:]) / 2.0))
+
+    assert data["velocity_source"] == "measured_interpolated"
+    assert math.isclose(data["total_seconds"], round(float(expected), 1))